@@ -7,12 +7,34 @@ colors for visualization, and persistence across sessions.
 
 import json
 import random
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from collections import Counter
+import numpy as np
+from typing import Dict, ItemsView, List, Mapping, Optional, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
+from types import MappingProxyType
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+def _dumps(data) -> str:
+    """Serialize to a compact JSON string, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(data, separators=(',', ':'))
+
+
+def _loads(json_str):
+    """Parse a JSON string or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(json_str)
+    return json.loads(json_str)
+
+
+@dataclass(slots=True)
 class FileMetadata:
     """Metadata for a file stored in memory."""
     filename: str
@@ -24,10 +46,37 @@ class FileMetadata:
     allocation_algorithm: str
     timestamp: str
     pages_list: List[int]
+    # Built from pages_list on the first membership check; not serialized or compared
+    _pages_set: Optional[frozenset] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def pages_set(self) -> frozenset:
+        """Page numbers as a frozenset for O(1) membership checks."""
+        if self._pages_set is None:
+            self._pages_set = frozenset(self.pages_list)
+        return self._pages_set
+    
+    def pages_array(self) -> np.ndarray:
+        """Page numbers as a fresh int64 array."""
+        return np.asarray(self.pages_list, dtype=np.int64)
+    
+    def owns_page(self, page_number: int) -> bool:
+        """Check whether a page belongs to this file."""
+        return page_number in self.pages_set
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        return {
+            'filename': self.filename,
+            'starting_page': self.starting_page,
+            'pages_count': self.pages_count,
+            'file_size': self.file_size,
+            'end_page': self.end_page,
+            'color': self.color,
+            'allocation_algorithm': self.allocation_algorithm,
+            'timestamp': self.timestamp,
+            'pages_list': self.pages_list
+        }
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'FileMetadata':
@@ -38,25 +87,55 @@ class FileMetadata:
 class FileManager:
     """Manages file metadata and colors for visualization."""
     
+    PALETTE = (
+        '#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7',
+        '#DDA0DD', '#98D8C8', '#F7DC6F', '#BB8FCE', '#85C1E9',
+        '#F8C471', '#82E0AA', '#F1948A', '#D7BDE2', '#A3E4D7',
+        '#F9E79F', '#D5A6BD', '#AED6F1', '#A9DFBF'
+    )
+    _PALETTE_BITS = {color: 1 << i for i, color in enumerate(PALETTE)}
+    _PALETTE_FULL = (1 << len(PALETTE)) - 1
+    # Packed big-endian RGBA for pages no file owns (#F0F0F0, opaque)
+    FREE_RGBA = 0xF0F0F0FF
+    
     def __init__(self):
         self.files: Dict[str, FileMetadata] = {}
+        # Live read-only view handed out by get_all_files
+        self._files_view = MappingProxyType(self.files)
+        # Reverse index (page -> unique_key) so page lookups don't scan every file;
+        # None until first needed after a load
+        self._page_index: Optional[Dict[int, str]] = {}
+        # Cached NumPy copies of each file's pages_list, built on first use
+        self._page_arrays: Dict[str, np.ndarray] = {}
         self.used_colors: set = set()
-        self.color_palette = [
-            '#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7',
-            '#DDA0DD', '#98D8C8', '#F7DC6F', '#BB8FCE', '#85C1E9',
-            '#F8C471', '#82E0AA', '#F1948A', '#85C1E9', '#D7BDE2',
-            '#A3E4D7', '#F9E79F', '#D5A6BD', '#AED6F1', '#A9DFBF'
-        ]
+        # Running totals kept in step with self.files so get_statistics is O(1)
+        self._total_pages = 0
+        self._total_size = 0
+        self._algo_counts: Counter = Counter()
+        # Bit i is set while PALETTE[i] is assigned to a file
+        self._used_mask = 0
+        # Bumped on every change to the file set so callers can cache derived views
+        self.version = 0
+        # (version, total_pages, array) of the last get_color_array result
+        self._color_array_cache: Optional[Tuple[int, int, np.ndarray]] = None
+    
+    def _rebuild_used_mask(self):
+        """Recompute the palette bitmask from used_colors."""
+        self._used_mask = 0
+        for color in self.used_colors:
+            self._used_mask |= self._PALETTE_BITS.get(color, 0)
     
     def get_unique_color(self) -> str:
         """Get a unique color for a new file."""
-        available_colors = [c for c in self.color_palette if c not in self.used_colors]
-        
-        if not available_colors:
-            # If all colors are used, generate a random color
-            color = f"#{random.randint(0, 255):02x}{random.randint(0, 255):02x}{random.randint(0, 255):02x}"
+        free = self._PALETTE_FULL & ~self._used_mask
+        if free:
+            # Lowest free palette slot
+            bit = free & -free
+            self._used_mask |= bit
+            color = self.PALETTE[bit.bit_length() - 1]
         else:
-            color = random.choice(available_colors)
+            # If all colors are used, generate a random color
+            color = f"#{random.randint(0, 0xFFFFFF):06x}"
         
         self.used_colors.add(color)
         return color
@@ -83,6 +162,13 @@ class FileManager:
         # Use filename + timestamp as unique key to handle duplicate filenames
         unique_key = f"{filename}_{timestamp}"
         self.files[unique_key] = file_metadata
+        if self._page_index is not None:
+            for page in pages_list:
+                self._page_index[page] = unique_key
+        self._total_pages += pages_count
+        self._total_size += file_size
+        self._algo_counts[allocation_algorithm] += 1
+        self.version += 1
         
         return file_metadata
     
@@ -91,7 +177,20 @@ class FileManager:
         if unique_key in self.files:
             file_metadata = self.files[unique_key]
             self.used_colors.discard(file_metadata.color)
+            self._used_mask &= ~self._PALETTE_BITS.get(file_metadata.color, 0)
+            if self._page_index is not None:
+                for page in file_metadata.pages_list:
+                    if self._page_index.get(page) == unique_key:
+                        del self._page_index[page]
+            self._page_arrays.pop(unique_key, None)
+            self._total_pages -= file_metadata.pages_count
+            self._total_size -= file_metadata.file_size
+            algo = file_metadata.allocation_algorithm
+            self._algo_counts[algo] -= 1
+            if self._algo_counts[algo] <= 0:
+                del self._algo_counts[algo]
             del self.files[unique_key]
+            self.version += 1
             return True
         return False
     
@@ -99,32 +198,34 @@ class FileManager:
         """Get file metadata by unique key."""
         return self.files.get(unique_key)
     
-    def get_all_files(self) -> Dict[str, FileMetadata]:
-        """Get all stored files."""
-        return self.files.copy()
+    def get_all_files(self) -> Mapping[str, FileMetadata]:
+        """Get a read-only live view of all stored files."""
+        return self._files_view
     
-    def get_files_list(self) -> List[Tuple[str, FileMetadata]]:
-        """Get list of (unique_key, metadata) tuples."""
-        return list(self.files.items())
+    def get_files_list(self) -> ItemsView[str, FileMetadata]:
+        """Get a live view of (unique_key, metadata) pairs; wrap in list() for a snapshot."""
+        return self.files.items()
     
     def get_page_color(self, page_number: int) -> Optional[str]:
         """Get the color of a specific page if it belongs to a file."""
-        for file_metadata in self.files.values():
-            if page_number in file_metadata.pages_list:
-                return file_metadata.color
-        return None
+        file_metadata = self.files.get(self._get_page_index().get(page_number))
+        return file_metadata.color if file_metadata else None
     
     def get_page_file_info(self, page_number: int) -> Optional[Tuple[str, FileMetadata]]:
         """Get file info for a specific page."""
-        for unique_key, file_metadata in self.files.items():
-            if page_number in file_metadata.pages_list:
-                return unique_key, file_metadata
-        return None
+        unique_key = self._get_page_index().get(page_number)
+        file_metadata = self.files.get(unique_key)
+        return (unique_key, file_metadata) if file_metadata else None
     
     def clear_all(self):
         """Clear all files and reset colors."""
         self.files.clear()
         self.used_colors.clear()
+        self._page_index = {}
+        self._page_arrays.clear()
+        self._used_mask = 0
+        self._rebuild_totals()
+        self.version += 1
     
     def to_json(self) -> str:
         """Serialize to JSON string."""
@@ -132,12 +233,12 @@ class FileManager:
             'files': {key: metadata.to_dict() for key, metadata in self.files.items()},
             'used_colors': list(self.used_colors)
         }
-        return json.dumps(data, indent=2)
+        return _dumps(data)
     
     def from_json(self, json_str: str):
         """Load from JSON string."""
         try:
-            data = json.loads(json_str)
+            data = _loads(json_str)
             self.files = {
                 key: FileMetadata.from_dict(metadata_dict) 
                 for key, metadata_dict in data.get('files', {}).items()
@@ -147,41 +248,105 @@ class FileManager:
             # If loading fails, start fresh
             self.files.clear()
             self.used_colors.clear()
+        self._after_load()
+    
+    def _after_load(self):
+        """Reset derived indexes, caches and totals after replacing self.files."""
+        self._files_view = MappingProxyType(self.files)
+        self._page_index = None
+        self._page_arrays.clear()
+        self._rebuild_used_mask()
+        self._rebuild_totals()
+        self.version += 1
+    
+    def _rebuild_totals(self):
+        """Recompute the running statistics totals from self.files."""
+        self._total_pages = 0
+        self._total_size = 0
+        self._algo_counts = Counter()
+        for file_metadata in self.files.values():
+            self._total_pages += file_metadata.pages_count
+            self._total_size += file_metadata.file_size
+            self._algo_counts[file_metadata.allocation_algorithm] += 1
+    
+    def _get_page_index(self) -> Dict[int, str]:
+        """Get the page -> unique_key index, rebuilding it from self.files if needed."""
+        if self._page_index is None:
+            self._page_index = {
+                page: unique_key
+                for unique_key, file_metadata in self.files.items()
+                for page in file_metadata.pages_list
+            }
+        return self._page_index
+    
+    def _pages_array(self, unique_key: str) -> np.ndarray:
+        """Get a file's pages_list as a cached int64 array."""
+        pages = self._page_arrays.get(unique_key)
+        if pages is None:
+            pages = self.files[unique_key].pages_array()
+            self._page_arrays[unique_key] = pages
+        return pages
+    
+    def get_owner_map(self, total_pages: int) -> Tuple[np.ndarray, List[Tuple[str, str]]]:
+        """
+        Get a per-page owner array and the table it indexes into.
+        
+        Returns:
+            tuple: (owner, owners) where owner is an int32 array holding an index
+            into owners for every page (-1 for free pages) and owners is a list of
+            (unique_key, color) tuples.
+        """
+        owner = np.full(total_pages, -1, dtype=np.int32)
+        owners = []
+        
+        for owner_id, (unique_key, file_metadata) in enumerate(self.files.items()):
+            pages = self._pages_array(unique_key)
+            pages = pages[(pages >= 0) & (pages < total_pages)]
+            owner[pages] = owner_id
+            owners.append((unique_key, file_metadata.color))
+        
+        return owner, owners
+    
+    def get_color_array(self, total_pages: int) -> np.ndarray:
+        """
+        Get every page's display color as packed big-endian RGBA.
+        
+        The result is cached until the file set changes. Viewing it as uint8 and
+        reshaping to (-1, 4) gives an RGBA image buffer.
+        
+        Returns:
+            np.ndarray: '>u4' array of length total_pages, FREE_RGBA for free pages.
+        """
+        cached = self._color_array_cache
+        if cached is not None and cached[0] == self.version and cached[1] == total_pages:
+            return cached[2]
+        
+        owner, owners = self.get_owner_map(total_pages)
+        # Last slot is the free color, so owner == -1 indexes it directly
+        lut = np.array([(int(color[1:7], 16) << 8) | 0xFF for _, color in owners] + [self.FREE_RGBA],
+                       dtype='>u4')
+        colors = lut[owner]
+        self._color_array_cache = (self.version, total_pages, colors)
+        return colors
     
     def get_memory_map(self, total_pages: int) -> List[Optional[Tuple[str, str]]]:
         """Get memory map showing which pages belong to which files."""
+        owner, owners = self.get_owner_map(total_pages)
         memory_map = [None] * total_pages
         
-        for unique_key, file_metadata in self.files.items():
-            for page in file_metadata.pages_list:
-                if 0 <= page < total_pages:
-                    memory_map[page] = (unique_key, file_metadata.color)
+        allocated = np.flatnonzero(owner >= 0)
+        for page, owner_id in zip(allocated.tolist(), owner[allocated].tolist()):
+            memory_map[page] = owners[owner_id]
         
         return memory_map
     
     def get_statistics(self) -> Dict:
         """Get statistics about stored files."""
-        if not self.files:
-            return {
-                'total_files': 0,
-                'total_pages_used': 0,
-                'total_size_bytes': 0,
-                'algorithms_used': {},
-                'average_file_size': 0
-            }
-        
-        total_pages = sum(f.pages_count for f in self.files.values())
-        total_size = sum(f.file_size for f in self.files.values())
-        algorithms = {}
-        
-        for file_metadata in self.files.values():
-            algo = file_metadata.allocation_algorithm
-            algorithms[algo] = algorithms.get(algo, 0) + 1
-        
+        total_files = len(self.files)
         return {
-            'total_files': len(self.files),
-            'total_pages_used': total_pages,
-            'total_size_bytes': total_size,
-            'algorithms_used': algorithms,
-            'average_file_size': total_size / len(self.files) if self.files else 0
+            'total_files': total_files,
+            'total_pages_used': self._total_pages,
+            'total_size_bytes': self._total_size,
+            'algorithms_used': dict(self._algo_counts),
+            'average_file_size': self._total_size / total_files if total_files else 0
         }
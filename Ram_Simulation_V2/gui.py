@@ -1,14 +1,12 @@
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
+import codecs
 import io
 import os
 import math
 import tempfile
 from ram import RAM
-from page_table import PageTable, PageTableEntry
+from page_table import PageTable, PageTableEntry, PRESENT, REFERENCED, MODIFIED, READ_ONLY
 from memory_allocators import AllocationComparator, AllocationResult
 from file_manager import FileManager, FileMetadata
 from paging_allocator import PagingAllocator
@@ -34,6 +32,18 @@ if 'file_manager' not in st.session_state:
     st.session_state.file_manager = FileManager()
 if 'allocation_comparator' not in st.session_state:
     st.session_state.allocation_comparator = None
+if 'paging_allocator' not in st.session_state:
+    st.session_state.paging_allocator = None
+
+
+def _memoize_in_session(key, version, build):
+    """Return session-cached value for key, rebuilding when version changes."""
+    cached = st.session_state.get(key)
+    if cached is None or cached[0] != version:
+        cached = (version, build())
+        st.session_state[key] = cached
+    return cached[1]
+
 
 def setup_environment():
     """Set up RAM and page table with user-defined parameters."""
@@ -64,6 +74,12 @@ def setup_environment():
         st.session_state.file_info = None
         st.session_state.file_manager = FileManager()
         st.session_state.allocation_comparator = AllocationComparator(ram, page_table)
+        st.session_state.paging_allocator = PagingAllocator(page_table, ram)
+        st.session_state.pop('_comparison_cache', None)
+        st.session_state.pop('_file_choices_cache', None)
+        st.session_state.pop('_memory_map_cache', None)
+        st.session_state.pop('_page_range_frame_cache', None)
+        st.session_state.pop('_allocated_frame_cache', None)
         
         st.success("Memory system created successfully!")
         
@@ -112,8 +128,12 @@ def store_file():
             # Show algorithm comparison (existing flow)
             st.subheader("🔍 Algorithm Comparison")
             
+            # Only rerun the comparison when memory layout or request size changes
             with st.spinner("Analyzing allocation algorithms..."):
-                comparison_results = comparator.compare_algorithms(pages_needed)
+                comparison_results = _memoize_in_session(
+                    '_comparison_cache', (page_table.version, pages_needed),
+                    lambda: comparator.compare_algorithms(pages_needed)
+                )
             
             # Display comparison results
             display_algorithm_comparison(comparison_results)
@@ -137,7 +157,8 @@ def store_file():
                 return
             
             # Default to recommended algorithm
-            default_index = successful_algos.index(recommended_algo) if recommended_algo in successful_algos else 0
+            algo_index = {name: i for i, name in enumerate(successful_algos)}
+            default_index = algo_index.get(recommended_algo, 0)
             
             selected_algorithm = st.selectbox(
                 "Select allocation algorithm:",
@@ -164,8 +185,7 @@ def store_file():
             st.info("Non-contiguous allocation will store your file using paging, which allows pages to be stored anywhere in memory.")
             
             if st.button("🚀 Store File Using Paging", type="primary"):
-                # Create paging allocator
-                paging_allocator = PagingAllocator(page_table, ram)
+                paging_allocator = st.session_state.paging_allocator
                 
                 # Allocate pages non-contiguously
                 success, starting_page, allocated_pages = paging_allocator.allocate(file_size)
@@ -174,28 +194,27 @@ def store_file():
                     st.error("Failed to allocate pages using paging.")
                     return
                 
-                # Read file contents
-                file_data = uploaded_file.getvalue()
+                # Stream the upload through one page-sized buffer
+                uploaded_file.seek(0)
+                page_buffer = memoryview(bytearray(page_table.page_size))
                 
                 # Create progress indicators
                 progress_bar = st.progress(0)
                 status_text = st.empty()
                 
-                # Store file data page by page
-                for i, page_num in enumerate(allocated_pages):
-                    progress = int((i / pages_needed) * 100)
-                    progress_bar.progress(progress)
-                    status_text.text(f"Storing data in page {page_num}...")
+                # Store file data page by page, only redrawing progress when it moves
+                base_addrs = (np.asarray(allocated_pages, dtype=np.int64) * page_table.page_size).tolist()
+                last_progress = -1
+                for i, (page_num, base_addr) in enumerate(zip(allocated_pages, base_addrs)):
+                    progress = (i * 100) // pages_needed
+                    if progress != last_progress:
+                        progress_bar.progress(progress)
+                        status_text.text(f"Storing data in page {page_num}...")
+                        last_progress = progress
                     
-                    # Calculate data chunk for this page
-                    start_offset = i * page_table.page_size
-                    end_offset = min((i + 1) * page_table.page_size, file_size)
-                    data_chunk = file_data[start_offset:end_offset]
-                    
-                    # Write data chunk byte by byte
-                    for j, byte_value in enumerate(data_chunk):
-                        virtual_addr = (page_num * page_table.page_size) + j
-                        page_table.write_byte(virtual_addr, byte_value)
+                    # Write this page's chunk in one go
+                    chunk_size = uploaded_file.readinto(page_buffer)
+                    page_table.write_bytes(base_addr, page_buffer[:chunk_size])
                         
                 progress_bar.progress(100)
                 status_text.text("File stored successfully!")
@@ -205,7 +224,7 @@ def store_file():
                     filename=uploaded_file.name,
                     starting_page=min(allocated_pages),
                     pages_count=len(allocated_pages),
-                    file_size=len(file_data),
+                    file_size=file_size,
                     allocation_algorithm="Non-contiguous (Paging)",
                     pages_list=allocated_pages
                 )
@@ -217,8 +236,7 @@ def store_file():
                 display_file_info(file_metadata)
                 
                 # Show visualization
-                visualize_file_allocation(allocated_pages, page_table, file_metadata.color, uploaded_file.name)
-                visualize_file_allocation(allocated_pages, page_table, file_metadata.color, uploaded_file.name)
+                visualize_file_allocation(file_metadata, page_table)
 
 
 def store_file_with_algorithm(uploaded_file, algorithm, file_manager, ram, page_table, pages_needed):
@@ -227,8 +245,7 @@ def store_file_with_algorithm(uploaded_file, algorithm, file_manager, ram, page_
     status_text = st.empty()
     
     try:
-        # Read file contents
-        file_data = uploaded_file.getvalue()
+        file_size = uploaded_file.size
         
         # Get the allocator and perform real allocation
         comparator = st.session_state.allocation_comparator
@@ -248,31 +265,35 @@ def store_file_with_algorithm(uploaded_file, algorithm, file_manager, ram, page_
         progress_bar.progress(50)
         status_text.text("Writing file data...")
         
-        # Store file data page by page
-        for i, page_num in enumerate(allocated_pages):
-            progress = 50 + int((i / len(allocated_pages)) * 40)
-            progress_bar.progress(progress)
-            status_text.text(f"Writing to page {page_num}...")
-            
-            # Calculate data chunk for this page
-            start_offset = i * page_table.page_size
-            end_offset = min((i + 1) * page_table.page_size, len(file_data))
-            data_chunk = file_data[start_offset:end_offset]
+        # Stream the upload through one page-sized buffer
+        uploaded_file.seek(0)
+        page_buffer = memoryview(bytearray(page_table.page_size))
+        
+        # Store file data page by page, only redrawing progress when it moves
+        base_addrs = (np.asarray(allocated_pages, dtype=np.int64) * page_table.page_size).tolist()
+        last_progress = -1
+        for i, (page_num, base_addr) in enumerate(zip(allocated_pages, base_addrs)):
+            progress = 50 + (i * 40) // len(allocated_pages)
+            if progress != last_progress:
+                progress_bar.progress(progress)
+                status_text.text(f"Writing to page {page_num}...")
+                last_progress = progress
             
-            # Write data chunk byte by byte
-            for j, byte_value in enumerate(data_chunk):
-                virtual_addr = (page_num * page_table.page_size) + j
-                page_table.write_byte(virtual_addr, byte_value)
+            # Write this page's chunk in one go
+            chunk_size = uploaded_file.readinto(page_buffer)
+            page_table.write_bytes(base_addr, page_buffer[:chunk_size])
         
         progress_bar.progress(90)
         status_text.text("Updating file registry...")
         
+        first_page, last_page = min(allocated_pages), max(allocated_pages)
+        
         # Add file to manager
         file_metadata = file_manager.add_file(
             filename=uploaded_file.name,
-            starting_page=min(allocated_pages),
+            starting_page=first_page,
             pages_count=len(allocated_pages),
-            file_size=len(file_data),
+            file_size=file_size,
             allocation_algorithm=algorithm,
             pages_list=allocated_pages
         )
@@ -280,10 +301,10 @@ def store_file_with_algorithm(uploaded_file, algorithm, file_manager, ram, page_
         # Store file metadata in session state for backward compatibility
         st.session_state.file_info = {
             "filename": uploaded_file.name,
-            "starting_page": min(allocated_pages),
+            "starting_page": first_page,
             "pages_count": len(allocated_pages),
-            "file_size": len(file_data),
-            "end_page": max(allocated_pages),
+            "file_size": file_size,
+            "end_page": last_page,
             "algorithm": algorithm,
             "pages_list": allocated_pages
         }
@@ -297,37 +318,32 @@ def store_file_with_algorithm(uploaded_file, algorithm, file_manager, ram, page_
         display_file_info(file_metadata)
         
         # Show visualization
-        visualize_file_allocation(allocated_pages, page_table, file_metadata.color, uploaded_file.name)
+        visualize_file_allocation(file_metadata, page_table)
         
     except Exception as e:
         st.error(f"Error storing file: {e}")
         # Cleanup on error
         if 'allocated_pages' in locals():
-            for page_num in allocated_pages:
-                try:
-                    page_table.deallocate_page(page_num)
-                except:
-                    pass
+            page_table.deallocate_pages(allocated_pages)
 
 
 def display_algorithm_comparison(results):
     """Display a comparison chart of allocation algorithms."""
+    import pandas as pd
+    import plotly.graph_objects as go
+    
     if not results:
         return
     
-    # Create comparison DataFrame
-    comparison_data = []
-    for algo_name, result in results.items():
-        comparison_data.append({
-            'Algorithm': algo_name,
-            'Success': '✅' if result.success else '❌',
-            'Execution Time (ms)': f"{result.execution_time * 1000:.2f}",
-            'Fragmentation (%)': f"{result.fragmentation * 100:.1f}" if result.success else "N/A",
-            'Efficiency Score': f"{result.efficiency_score:.2f}" if result.success else "0.00",
-            'Status': result.reason
-        })
-    
-    df = pd.DataFrame(comparison_data)
+    # Create comparison DataFrame column by column
+    df = pd.DataFrame({
+        'Algorithm': list(results),
+        'Success': ['✅' if r.success else '❌' for r in results.values()],
+        'Execution Time (ms)': [f"{r.execution_time * 1000:.2f}" for r in results.values()],
+        'Fragmentation (%)': [f"{r.fragmentation * 100:.1f}" if r.success else "N/A" for r in results.values()],
+        'Efficiency Score': [f"{r.efficiency_score:.2f}" if r.success else "0.00" for r in results.values()],
+        'Status': [r.reason for r in results.values()]
+    })
     st.dataframe(df, use_container_width=True)
     
     # Create efficiency chart for successful algorithms
@@ -337,14 +353,16 @@ def display_algorithm_comparison(results):
         # Efficiency comparison chart
         fig = go.Figure()
         
-        algorithms = list(successful_results.keys())
-        execution_times = [r.execution_time * 1000 for r in successful_results.values()]
-        fragmentations = [r.fragmentation * 100 for r in successful_results.values()]
-        efficiency_scores = [r.efficiency_score for r in successful_results.values()]
+        # One pass over the results: columns are time (ms), fragmentation (%), efficiency
+        algorithms = list(successful_results)
+        metrics = np.array([
+            (r.execution_time * 1000, r.fragmentation * 100, r.efficiency_score)
+            for r in successful_results.values()
+        ])
         
         fig.add_trace(go.Scatter(
             x=algorithms,
-            y=execution_times,
+            y=metrics[:, 0],
             mode='lines+markers',
             name='Execution Time (ms)',
             line=dict(color='blue'),
@@ -353,7 +371,7 @@ def display_algorithm_comparison(results):
         
         fig.add_trace(go.Scatter(
             x=algorithms,
-            y=fragmentations,
+            y=metrics[:, 1],
             mode='lines+markers',
             name='Fragmentation (%)',
             line=dict(color='red'),
@@ -362,7 +380,7 @@ def display_algorithm_comparison(results):
         
         fig.add_trace(go.Bar(
             x=algorithms,
-            y=efficiency_scores,
+            y=metrics[:, 2],
             name='Efficiency Score',
             marker_color='green',
             opacity=0.6,
@@ -401,62 +419,51 @@ def display_file_info(file_metadata):
         st.write(f"**Pages List:** {file_metadata.pages_list[:10]}{'...' if len(file_metadata.pages_list) > 10 else ''}")
 
 
-def visualize_file_allocation(allocated_pages, page_table, color, filename):
+def visualize_file_allocation(file_metadata, page_table):
     """Visualize how a file is allocated across pages."""
+    import plotly.graph_objects as go
+    
+    allocated_pages = file_metadata.pages_list
+    color = file_metadata.color
+    filename = file_metadata.filename
+    
     try:
         st.subheader("🎯 File Allocation Visualization")
         
-        # Create a visualization showing which pages are used by the file
-        fig, ax = plt.subplots(figsize=(12, 4))
-        
         # Get status of pages to show in visualization
         display_range = min(max(allocated_pages) + 20, page_table.num_pages)
         start_range = max(0, min(allocated_pages) - 10)
         
-        all_pages = range(start_range, display_range)
-        page_status = []
-        page_colors = []
+        # New file pages, other allocated pages, then unallocated pages
+        pages = np.arange(start_range, display_range)
+        is_new = np.isin(pages, file_metadata.pages_array())
+        is_allocated = (page_table.flags[start_range:display_range] & PRESENT).astype(bool) & ~is_new
+        is_free = ~(is_new | is_allocated)
         
-        for page in all_pages:
-            if page in allocated_pages:
-                page_status.append(2)  # New file pages
-                page_colors.append(color)
-            elif page_table.table[page].present:
-                page_status.append(1)  # Other allocated pages
-                page_colors.append('#CCCCCC')
-            else:
-                page_status.append(0)  # Unallocated pages
-                page_colors.append('#FFFFFF')
-        
-        # Create bar chart
-        bars = ax.bar(range(len(all_pages)), [1]*len(all_pages), color=page_colors, edgecolor='black', linewidth=0.5)
-        
-        # Customize the plot
-        ax.set_title(f'Memory Allocation for "{filename}"', fontsize=14, fontweight='bold')
-        ax.set_xlabel('Page Numbers')
-        ax.set_ylabel('Allocated')
-        ax.set_ylim(0, 1.2)
-        
-        # Set x-axis labels
-        tick_step = max(1, len(all_pages) // 20)
-        tick_positions = range(0, len(all_pages), tick_step)
-        ax.set_xticks(tick_positions)
-        ax.set_xticklabels([str(all_pages[i]) for i in tick_positions])
-        
-        # Add legend
-        from matplotlib.patches import Patch
-        legend_elements = [
-            Patch(facecolor=color, label=f'New File: {filename}'),
-            Patch(facecolor='#CCCCCC', label='Other Allocated Pages'),
-            Patch(facecolor='#FFFFFF', label='Free Pages')
-        ]
-        ax.legend(handles=legend_elements, loc='upper right')
+        # One trace per category so the legend matches the bar colors;
+        # Plotly draws in the browser, so the server only ships the arrays
+        fig = go.Figure()
+        for mask, bar_color, label in (
+            (is_new, color, f'New File: {filename}'),
+            (is_allocated, '#CCCCCC', 'Other Allocated Pages'),
+            (is_free, '#FFFFFF', 'Free Pages')
+        ):
+            fig.add_trace(go.Bar(
+                x=pages[mask],
+                y=np.ones(int(mask.sum())),
+                name=label,
+                marker=dict(color=bar_color, line=dict(color='black', width=0.5))
+            ))
         
-        # Remove y-axis ticks as they're not meaningful
-        ax.set_yticks([])
+        fig.update_layout(
+            title=f'Memory Allocation for "{filename}"',
+            xaxis=dict(title="Page Numbers"),
+            yaxis=dict(title="Allocated", range=[0, 1.2], showticklabels=False),
+            bargap=0,
+            height=350
+        )
         
-        plt.tight_layout()
-        st.pyplot(fig)
+        st.plotly_chart(fig, use_container_width=True)
         
     except Exception as e:
         st.error(f"Error visualizing file allocation: {e}")
@@ -472,15 +479,19 @@ def retrieve_file():
     page_table = st.session_state.page_table
     file_manager = st.session_state.file_manager
     
-    # Show available files
-    files = file_manager.get_files_list()
+    # Show available files; the selectbox labels only change with the file set
+    file_keys, file_options = _memoize_in_session(
+        '_file_choices_cache', file_manager.version,
+        lambda: (
+            list(file_manager.files),
+            [f"{file_meta.filename} ({unique_key})" for unique_key, file_meta in file_manager.get_files_list()]
+        )
+    )
     
-    if files:
+    if file_keys:
         st.subheader("📁 Available Files")
         
         # File selection
-        file_options = [f"{file_meta.filename} ({unique_key})" for unique_key, file_meta in files]
-        file_keys = [unique_key for unique_key, file_meta in files]
         
         selected_index = st.selectbox(
             "Select a file to retrieve:",
@@ -528,47 +539,53 @@ def retrieve_file():
 def retrieve_file_data(file_metadata, page_table):
     """Retrieve file data from memory."""
     try:
-        # Check if pages are allocated
-        for page_num in file_metadata.pages_list:
-            try:
-                if not page_table.table[page_num].present:
-                    st.error(f"Page {page_num} is not allocated. Cannot retrieve file.")
-                    return
-            except Exception as e:
-                st.error(f"Error checking page {page_num}: {e}")
-                return
+        # Check all pages are in range and allocated in one pass over the present bitmap
+        pages = file_metadata.pages_array()
+        out_of_range = pages[(pages < 0) | (pages >= page_table.num_pages)]
+        if out_of_range.size:
+            st.error(f"Pages out of range: {out_of_range[:10].tolist()}. Cannot retrieve file.")
+            return
+        missing = pages[(page_table.flags[pages] & PRESENT) == 0]
+        if missing.size:
+            more = f" and {missing.size - 10} more" if missing.size > 10 else ""
+            st.error(f"Pages not allocated: {missing[:10].tolist()}{more}. Cannot retrieve file.")
+            return
         
-        # Retrieve file data
-        file_data = bytearray()
+        # Retrieve file data into one buffer sized for the whole file
+        buffer = memoryview(bytearray(file_metadata.file_size))
         
         progress_bar = st.progress(0)
         status_text = st.empty()
         
         bytes_read = 0
+        last_progress = -1
+        base_addrs = (pages * page_table.page_size).tolist()
         
-        for i, page_num in enumerate(file_metadata.pages_list):
-            base_addr = page_num * page_table.page_size
-            
-            progress = int((i / len(file_metadata.pages_list)) * 100)
-            progress_bar.progress(progress)
-            status_text.text(f"Reading page {page_num}...")
+        for i, (page_num, base_addr) in enumerate(zip(pages.tolist(), base_addrs)):
+            # Stop if we've read the entire file
+            remaining = file_metadata.file_size - bytes_read
+            if remaining <= 0:
+                break
             
-            # Read page data
-            for j in range(page_table.page_size):
-                # Stop if we've read the entire file
-                if bytes_read >= file_metadata.file_size:
-                    break
-                
-                try:
-                    byte_value = page_table.read_byte(base_addr + j)
-                    file_data.append(byte_value)
-                    bytes_read += 1
-                except Exception as e:
-                    st.warning(f"Error reading byte at address {base_addr + j}: {str(e)}")
-                    break  # Stop on error
+            # Only redraw progress when it moves
+            progress = (i * 100) // len(file_metadata.pages_list)
+            if progress != last_progress:
+                progress_bar.progress(progress)
+                status_text.text(f"Reading page {page_num}...")
+                last_progress = progress
             
-            if bytes_read >= file_metadata.file_size:
-                break
+            # Read this page's share of the file in one go
+            chunk_size = min(page_table.page_size, remaining)
+            try:
+                page_table.read_into(base_addr, buffer[bytes_read:bytes_read + chunk_size])
+            except Exception as e:
+                st.warning(f"Error reading page {page_num} at address {base_addr}: {str(e)}")
+                break  # Stop on error
+            bytes_read += chunk_size
+        
+        # download_button needs bytes, so convert whatever was read once
+        file_data = bytes(buffer[:bytes_read])
+        buffer.release()
         
         progress_bar.progress(100)
         status_text.text("File retrieved successfully!")
@@ -581,7 +598,7 @@ def retrieve_file_data(file_metadata, page_table):
         filename = file_metadata.filename
         st.download_button(
             label="📥 Download Retrieved File",
-            data=bytes(file_data),  # Convert bytearray to bytes
+            data=file_data,
             file_name=filename,
             mime="application/octet-stream" if not filename.lower().endswith('.pdf') else "application/pdf",
             type="primary"
@@ -592,7 +609,10 @@ def retrieve_file_data(file_metadata, page_table):
         # Show file preview if it's text
         if filename.lower().endswith(('.txt', '.csv', '.json', '.py', '.html', '.css', '.js')):
             try:
-                preview_text = file_data.decode('utf-8')[:1000]  # First 1000 characters
+                # Decode only enough bytes for 1000 characters (UTF-8 is at most 4 bytes
+                # each); the incremental decoder tolerates a character cut off at the end
+                decoder = codecs.getincrementaldecoder('utf-8')()
+                preview_text = decoder.decode(file_data[:4000])[:1000]  # First 1000 characters
                 st.subheader("📄 File Preview")
                 st.code(preview_text, language=filename.split('.')[-1] if '.' in filename else 'text')
                 if len(file_data) > 1000:
@@ -603,6 +623,14 @@ def retrieve_file_data(file_metadata, page_table):
     except Exception as e:
         st.error(f"Error retrieving file: {e}")
 
+def display_metrics(stats):
+    """Display a dict of statistics as Streamlit metrics."""
+    for key, value in stats.items():
+        if 'percentage' in key and isinstance(value, float):
+            st.metric(label=key, value=f"{value:.2f}%")
+        else:
+            st.metric(label=key, value=value)
+
 def view_memory_usage():
     """Display memory usage statistics and visualizations."""
     st.header("Memory Usage")
@@ -619,40 +647,14 @@ def view_memory_usage():
     with col1:
         st.subheader("RAM Usage")
         try:
-            ram_usage = ram.get_memory_usage()
-            
-            # Create a DataFrame for better display
-            ram_data = []
-            for key, value in ram_usage.items():
-                if 'percentage' in key and isinstance(value, float):
-                    ram_data.append({"Metric": key, "Value": f"{value:.2f}%"})
-                else:
-                    ram_data.append({"Metric": key, "Value": value})
-            
-            ram_df = pd.DataFrame(ram_data)
-            st.table(ram_df)
-            
-            
+            display_metrics(ram.get_memory_usage())
         except Exception as e:
             st.error(f"Error displaying RAM usage: {e}")
     
     with col2:
         st.subheader("Page Table Statistics")
         try:
-            page_stats = page_table.get_table_statistics()
-            
-            # Create a DataFrame for better display
-            page_data = []
-            for key, value in page_stats.items():
-                if 'percentage' in key and isinstance(value, float):
-                    page_data.append({"Metric": key, "Value": f"{value:.2f}%"})
-                else:
-                    page_data.append({"Metric": key, "Value": value})
-            
-            page_df = pd.DataFrame(page_data)
-            st.table(page_df)
-            
-            
+            display_metrics(page_table.get_table_statistics())
         except Exception as e:
             st.error(f"Error displaying page table statistics: {e}")
 
@@ -691,88 +693,83 @@ def view_page_table():
     elif view_option == "View summary statistics":
         display_table_statistics(page_table)
 
+def _page_table_frame(page_table, page_nums):
+    """Build a page table DataFrame for the given pages, one column at a time."""
+    import pandas as pd
+    
+    page_nums = np.asarray(page_nums, dtype=np.int64)
+    flags = page_table.flags[page_nums]
+    frames = page_table.frame_numbers[page_nums]
+    return pd.DataFrame({
+        "Page #": page_nums,
+        "Frame #": np.where(frames >= 0, frames.astype(str), "N/A"),
+        "Status": np.where(flags & PRESENT, "Present", "Not Present"),
+        "Referenced": np.where(flags & REFERENCED, "Yes", "No"),
+        "Modified": np.where(flags & MODIFIED, "Yes", "No"),
+        "Read Only": np.where(flags & READ_ONLY, "Yes", "No")
+    })
+
 def display_page_table_range(page_table, start, end):
     """Display a range of page table entries."""
-    data = []
+    page_nums = list(range(start, end + 1))
     
-    for page_num in range(start, end + 1):
-        try:
-            entry = page_table.table[page_num]
-            frame = str(entry.frame_number) if entry.frame_number is not None else "N/A"
-            status = "Present" if entry.present else "Not Present"
-            
-            data.append({
-                "Page #": page_num,
-                "Frame #": frame,
-                "Status": status,
-                "Referenced": "Yes" if entry.referenced else "No",
-                "Modified": "Yes" if entry.modified else "No",
-                "Read Only": "Yes" if entry.read_only else "No"
-            })
-        except Exception as e:
-            st.error(f"Error accessing page {page_num}: {e}")
-    
-    if not data:
+    if not page_nums:
         st.warning("No page data to display.")
         return
-        
-    df = pd.DataFrame(data)
+    
+    try:
+        df = _memoize_in_session(
+            '_page_range_frame_cache', (page_table.version, start, end),
+            lambda: _page_table_frame(page_table, page_nums)
+        )
+    except Exception as e:
+        st.error(f"Error accessing pages {start}-{end}: {e}")
+        return
+    
     st.dataframe(df, use_container_width=True)
     
       
 
 def display_allocated_pages(page_table):
     """Display only allocated pages in the page table."""
-    allocated_pages = []
-    
     try:
-        for page_num in range(page_table.num_pages):
-            if page_table.table[page_num].present:
-                allocated_pages.append(page_num)
+        allocated_pages = page_table.allocated_page_indices()
     except Exception as e:
         st.error(f"Error scanning allocated pages: {e}")
         return
     
-    if not allocated_pages:
+    if not allocated_pages.size:
         st.info("No pages are currently allocated.")
         return
     
-    data = []
-    for page_num in allocated_pages:
-        try:
-            entry = page_table.table[page_num]
-            frame = str(entry.frame_number) if entry.frame_number is not None else "N/A"
-            status = "Present" if entry.present else "Not Present"
-            
-            data.append({
-                "Page #": page_num,
-                "Frame #": frame,
-                "Status": status,
-                "Referenced": "Yes" if entry.referenced else "No",
-                "Modified": "Yes" if entry.modified else "No",
-                "Read Only": "Yes" if entry.read_only else "No"
-            })
-        except Exception as e:
-            st.warning(f"Error accessing page {page_num}: {e}")
+    # Only build rows for one window of allocated pages at a time
+    total_allocated = len(allocated_pages)
+    rows_per_view = 200
+    offset = 0
+    if total_allocated > rows_per_view:
+        offset = st.number_input(
+            "First allocated page to show",
+            0, total_allocated - 1, 0, step=rows_per_view,
+            help=f"Shows up to {rows_per_view} allocated pages starting at this position"
+        )
+    window = allocated_pages[offset:offset + rows_per_view].tolist()
+    
+    try:
+        df = _memoize_in_session(
+            '_allocated_frame_cache', (page_table.version, offset),
+            lambda: _page_table_frame(page_table, window)
+        )
+    except Exception as e:
+        st.warning(f"Error accessing allocated pages: {e}")
+        return
     
-    st.write(f"Allocated Pages ({len(allocated_pages)} total):")
-    df = pd.DataFrame(data)
+    st.write(f"Allocated Pages ({total_allocated} total, showing {offset + 1}-{offset + len(window)}):")
     st.dataframe(df, use_container_width=True)
 
 def display_table_statistics(page_table):
     """Display summary statistics about the page table."""
     try:
-        stats = page_table.get_table_statistics()
-        
-        data = []
-        for key, value in stats.items():
-            if 'percentage' in key and isinstance(value, float):
-                data.append({"Metric": key, "Value": f"{value:.2f}%"})
-            else:
-                data.append({"Metric": key, "Value": value})
-        
-        df = pd.DataFrame(data)
-        st.table(df)
+        display_metrics(page_table.get_table_statistics())
     except Exception as e:
         st.error(f"Error getting page table statistics: {e}")
 
@@ -803,8 +800,11 @@ def view_memory_map():
     
     end_page = min(start_page + pages_to_show, total_pages)
     
-    # Get memory map
-    memory_map = file_manager.get_memory_map(total_pages)
+    # Get memory map, rebuilt only when files are added or removed
+    memory_map = _memoize_in_session(
+        '_memory_map_cache', (file_manager.version, total_pages),
+        lambda: file_manager.get_memory_map(total_pages)
+    )
     
     # Display file statistics
     stats = file_manager.get_statistics()
@@ -823,11 +823,13 @@ def view_memory_map():
         
         # Algorithm usage
         if stats['algorithms_used']:
+            import pandas as pd
+            
             st.write("**Algorithms Used:**")
-            algo_cols = st.columns(len(stats['algorithms_used']))
-            for i, (algo, count) in enumerate(stats['algorithms_used'].items()):
-                with algo_cols[i]:
-                    st.metric(algo, count)
+            st.dataframe(
+                pd.DataFrame(list(stats['algorithms_used'].items()), columns=['Algorithm', 'Count']),
+                hide_index=True
+            )
     
     # Display memory map based on selected style
     if view_style == "Grid":
@@ -841,156 +843,154 @@ def view_memory_map():
     display_file_management(file_manager, page_table)
 
 
+def _session_figure(key, figsize):
+    """Return a cleared (fig, ax) pair kept in session state and reused across reruns."""
+    cached = st.session_state.get(key)
+    if cached is None:
+        from matplotlib.figure import Figure
+        
+        # Built without pyplot so the figure is not held by its global registry
+        fig = Figure(figsize=figsize)
+        cached = (fig, fig.subplots())
+        st.session_state[key] = cached
+    else:
+        cached[1].clear()
+        cached[0].set_size_inches(figsize)
+    return cached
+
+
+def _memory_grid_html(start_page, end_page, memory_map, pages_per_row):
+    """Build the grid view as a CSS grid of colored cells, one div per page."""
+    cells = [
+        f'<div style="background:{file_info[1]};color:white">{start_page + offset}</div>'
+        if file_info else '<div></div>'
+        for offset, file_info in enumerate(memory_map[start_page:end_page])
+    ]
+    return (
+        '<style>'
+        '.memory-grid{display:grid;gap:1px;padding:1px;background:black;width:max-content;'
+        f'grid-template-columns:repeat({pages_per_row},28px);grid-auto-rows:20px}}'
+        '.memory-grid div{background:#F0F0F0;font-size:8px;display:flex;'
+        'align-items:center;justify-content:center}'
+        '</style>'
+        f'<div class="memory-grid">{"".join(cells)}</div>'
+    )
+
+
 def display_memory_grid(start_page, end_page, memory_map, file_manager):
     """Display memory as a color-coded grid."""
     st.subheader("Grid View")
     
     pages_per_row = 20
-    rows_needed = math.ceil((end_page - start_page) / pages_per_row)
-    
-    # Create the grid visualization
-    fig, ax = plt.subplots(figsize=(15, max(3, rows_needed * 0.5)))
     
-    grid_data = []
-    colors = []
+    st.caption(f"Memory Pages {start_page} - {end_page-1}")
+    st.markdown(_memory_grid_html(start_page, end_page, memory_map, pages_per_row),
+                unsafe_allow_html=True)
     
-    for row in range(rows_needed):
-        row_data = []
-        row_colors = []
-        
-        for col in range(pages_per_row):
-            page_idx = start_page + row * pages_per_row + col
-            if page_idx >= end_page:
-                row_data.append(0)
-                row_colors.append('#FFFFFF')
-            else:
-                file_info = memory_map[page_idx]
-                if file_info:
-                    row_data.append(1)
-                    row_colors.append(file_info[1])  # file color
-                else:
-                    row_data.append(0)
-                    row_colors.append('#F0F0F0')  # light gray for free pages
-        
-        grid_data.append(row_data)
-        colors.append(row_colors)
-    
-    # Create a custom colormap visualization
-    for row_idx, (row_data, row_colors) in enumerate(zip(grid_data, colors)):
-        for col_idx, (value, color) in enumerate(zip(row_data, row_colors)):
-            page_num = start_page + row_idx * pages_per_row + col_idx
-            if page_num < end_page:
-                rect = plt.Rectangle((col_idx, rows_needed - row_idx - 1), 1, 1, 
-                                   facecolor=color, edgecolor='black', linewidth=0.5)
-                ax.add_patch(rect)
-                
-                # Add page number text for allocated pages
-                if value == 1:
-                    ax.text(col_idx + 0.5, rows_needed - row_idx - 0.5, str(page_num), 
-                           ha='center', va='center', fontsize=6, color='white' if color != '#F0F0F0' else 'black')
-    
-    ax.set_xlim(0, pages_per_row)
-    ax.set_ylim(0, rows_needed)
-    ax.set_aspect('equal')
-    ax.set_title(f'Memory Pages {start_page} - {end_page-1}')
-    ax.set_xlabel('Page Index (within row)')
-    ax.set_ylabel('Row')
-    
-    # Remove ticks for cleaner look
-    ax.set_xticks(range(0, pages_per_row, 5))
-    ax.set_yticks(range(rows_needed))
-    ax.set_yticklabels([f"Row {i}" for i in range(rows_needed)])
-    
-    plt.tight_layout()
-    st.pyplot(fig)
-    
-    # Legend
+    # Legend, rendered as a single markdown element
     files = file_manager.get_all_files()
     if files:
         st.write("**Legend:**")
-        legend_cols = st.columns(min(4, len(files)))
-        for i, (unique_key, file_meta) in enumerate(files.items()):
-            with legend_cols[i % len(legend_cols)]:
-                st.write(f"<span style='color: {file_meta.color}; font-size: 20px;'>●</span> {file_meta.filename}", 
-                        unsafe_allow_html=True)
+        st.markdown(
+            "&nbsp;&nbsp;".join(
+                f"<span style='color: {file_meta.color}; font-size: 20px;'>●</span> {file_meta.filename}"
+                for file_meta in files.values()
+            ),
+            unsafe_allow_html=True
+        )
 
 
 def display_memory_linear(start_page, end_page, memory_map, file_manager):
     """Display memory as a linear visualization."""
     st.subheader("Linear View")
     
-    # Create a linear bar chart
-    fig, ax = plt.subplots(figsize=(15, 3))
+    # Render the pages as a single 1-pixel-high image strip
+    fig, ax = _session_figure('_linear_figure', (15, 3))
     
     page_range = range(start_page, end_page)
-    colors = []
-    
-    for page in page_range:
-        file_info = memory_map[page]
-        if file_info:
-            colors.append(file_info[1])  # file color
-        else:
-            colors.append('#F0F0F0')  # light gray for free pages
+    colors = file_manager.get_color_array(len(memory_map))
+    rgba = colors[start_page:end_page].view(np.uint8).reshape(1, -1, 4)
     
-    bars = ax.bar(range(len(page_range)), [1] * len(page_range), color=colors, 
-                  edgecolor='black', linewidth=0.3)
+    ax.imshow(rgba, aspect='auto', interpolation='nearest', extent=(0, len(page_range), 0, 1))
     
     ax.set_title(f'Linear Memory View: Pages {start_page} - {end_page-1}')
     ax.set_xlabel('Page Numbers')
     ax.set_ylabel('Allocated')
-    ax.set_ylim(0, 1.2)
     
     # Set x-axis labels
     tick_step = max(1, len(page_range) // 20)
     tick_positions = range(0, len(page_range), tick_step)
-    ax.set_xticks(tick_positions)
+    ax.set_xticks([i + 0.5 for i in tick_positions])
     ax.set_xticklabels([str(start_page + i) for i in tick_positions])
     
     # Remove y-axis ticks
     ax.set_yticks([])
     
-    plt.tight_layout()
-    st.pyplot(fig)
+    fig.tight_layout()
+    st.pyplot(fig, clear_figure=False)
 
 
 def display_memory_detailed(start_page, end_page, memory_map, file_manager, page_table):
     """Display detailed memory information in a table."""
+    import pandas as pd
+    
     st.subheader("Detailed View")
     
-    data = []
+    # One row per allocated page; free pages optionally collapse into range rows
+    window_present = page_table.flags[start_page:end_page] & PRESENT
+    spans = [(page, page) for page in (np.flatnonzero(window_present) + start_page).tolist()]
+    if st.checkbox("Show free page ranges", key="detailed_show_free"):
+        edges = np.diff(np.concatenate(([0], (window_present == 0).astype(np.int8), [0])))
+        run_starts = np.flatnonzero(edges == 1) + start_page
+        run_ends = np.flatnonzero(edges == -1) - 1 + start_page
+        spans += list(zip(run_starts.tolist(), run_ends.tolist()))
+        spans.sort()
+    
+    if not spans:
+        st.info(f"No allocated pages between {start_page} and {end_page - 1}.")
+        return
     
-    for page in range(start_page, end_page):
-        file_info = memory_map[page]
-        entry = page_table.table[page]
-        
-        if file_info:
-            unique_key, color = file_info
-            file_meta = file_manager.get_file(unique_key)
-            filename = file_meta.filename if file_meta else "Unknown"
-            algorithm = file_meta.allocation_algorithm if file_meta else "Unknown"
-        else:
-            filename = "Free"
-            algorithm = "N/A"
-            color = "#F0F0F0"
-        
-        data.append({
-            "Page #": page,
-            "Frame #": entry.frame_number if entry.present else "N/A",
-            "Status": "Allocated" if entry.present else "Free",
-            "File": filename,
-            "Algorithm": algorithm,
-            "Color": color
-        })
-    
-    df = pd.DataFrame(data)
-    
-    # Style the dataframe
-    def highlight_rows(row):
-        if row['Status'] == 'Allocated':
-            return [f'background-color: {row["Color"]}; color: white;' if row["Color"] != "#F0F0F0" else 'background-color: #F0F0F0;'] * len(row)
-        return [''] * len(row)
-    
-    styled_df = df.style.apply(highlight_rows, axis=1)
+    # Only build and send one window of rows per rerun
+    col1, col2 = st.columns(2)
+    with col1:
+        rows_per_view = st.number_input("Rows per view", 20, 200, 50, key="detailed_rows")
+    view_count = max(1, math.ceil(len(spans) / rows_per_view))
+    with col2:
+        view = st.number_input("View", 1, view_count, 1, key="detailed_view") if view_count > 1 else 1
+    spans = spans[(view - 1) * rows_per_view:view * rows_per_view]
+    
+    firsts = np.array([first for first, _ in spans], dtype=np.int64)
+    present = (page_table.flags[firsts] & PRESENT).astype(bool)
+    frames = page_table.frame_numbers[firsts]
+    infos = [memory_map[first] if is_present else None
+             for first, is_present in zip(firsts.tolist(), present.tolist())]
+    
+    file_details = {}
+    for file_info in infos:
+        if file_info and file_info[0] not in file_details:
+            file_meta = file_manager.get_file(file_info[0])
+            file_details[file_info[0]] = ((file_meta.filename, file_meta.allocation_algorithm)
+                                          if file_meta else ("Unknown", "Unknown"))
+    details = [file_details[info[0]] if info else ("Free", "N/A") for info in infos]
+    colors = [info[1] if info else "#F0F0F0" for info in infos]
+    
+    df = pd.DataFrame({
+        "Page #": [str(first) if first == last else f"{first}-{last}" for first, last in spans],
+        "Frame #": np.where(present, frames.astype(str), "N/A"),
+        "Status": np.where(present, "Allocated", "Free"),
+        "File": [filename for filename, _ in details],
+        "Algorithm": [algorithm for _, algorithm in details]
+    })
+    
+    # Color only the File column; each distinct color's CSS is built once
+    css_by_color = {
+        color: f"background-color: {color}; color: white;" if color != "#F0F0F0"
+        else "background-color: #F0F0F0;"
+        for color in set(colors)
+    }
+    file_styles = [css_by_color[color] if is_present else ""
+                   for color, is_present in zip(colors, present.tolist())]
+    styled_df = df.style.apply(lambda column: file_styles, subset=["File"])
     st.dataframe(styled_df, use_container_width=True)
 
 
@@ -998,7 +998,8 @@ def display_file_management(file_manager, page_table):
     """Display file management interface."""
     st.subheader("📁 File Management")
     
-    files = file_manager.get_files_list()
+    # Snapshot, since the Remove button mutates the file manager mid-loop
+    files = list(file_manager.get_files_list())
     
     if not files:
         st.info("No files stored yet.")
@@ -1020,12 +1021,8 @@ def display_file_management(file_manager, page_table):
             
             with col2:
                 if st.button(f"Remove", key=f"remove_{unique_key}"):
-                    # Deallocate pages
-                    for page_num in file_meta.pages_list:
-                        try:
-                            page_table.deallocate_page(page_num)
-                        except:
-                            pass  # Page might already be deallocated
+                    # Deallocate pages; any already freed are skipped
+                    page_table.deallocate_pages(file_meta.pages_array())
                     
                     # Remove from file manager
                     file_manager.remove_file(unique_key)
@@ -1,7 +1,9 @@
 from ram import RAM
-from page_table import PageTable, PageTableEntry
+from page_table import PageTable, PageTableEntry, PRESENT
 import os
 import math
+import mmap
+import numpy as np
 
 def print_separator(title):
     """Print a separator with a title for better readability."""
@@ -44,7 +46,11 @@ def setup_environment():
     ram_size_mb = get_int_input("RAM size in MB (1-64): ", 1, 64)
     ram_size = ram_size_mb * 1024 * 1024
     
-    frame_size_kb = get_int_input("Frame size in KB (1, 2, 4, 8, 16): ", 1, 16)
+    while True:
+        frame_size_kb = get_int_input("Frame size in KB (1, 2, 4, 8, 16): ", 1, 16)
+        if frame_size_kb & (frame_size_kb - 1) == 0:
+            break
+        print("Frame size must be one of 1, 2, 4, 8 or 16")
     frame_size = frame_size_kb * 1024
     
     ram = RAM(size=ram_size, frame_size=frame_size)
@@ -85,10 +91,12 @@ def file_operations_menu(ram, page_table):
                 input("\nPress Enter to continue...")
                 continue
             
+            file_data = b""
             try:
-                # Read file contents
+                # Map the file rather than reading it all into memory
                 with open(file_path, 'rb') as f:
-                    file_data = f.read()
+                    if os.fstat(f.fileno()).st_size:
+                        file_data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
                 
                 file_size = len(file_data)
                 print(f"File size: {file_size} bytes")
@@ -104,17 +112,7 @@ def file_operations_menu(ram, page_table):
                     continue
                 
                 # Find consecutive free pages
-                starting_page = None
-                for i in range(page_table.num_pages - pages_needed + 1):
-                    consecutive_free = True
-                    for j in range(pages_needed):
-                        if page_table.table[i + j].present:
-                            consecutive_free = False
-                            break
-                    
-                    if consecutive_free:
-                        starting_page = i
-                        break
+                starting_page = page_table.find_free_run(pages_needed)
                 
                 if starting_page is None:
                     print("Error: Could not find consecutive free pages for file storage.")
@@ -141,10 +139,8 @@ def file_operations_menu(ram, page_table):
                     end_offset = min((i + 1) * page_table.page_size, file_size)
                     data_chunk = file_data[start_offset:end_offset]
                     
-                    # Write data chunk byte by byte
-                    for j, byte_value in enumerate(data_chunk):
-                        virtual_addr = (page_num * page_table.page_size) + j
-                        page_table.write_byte(virtual_addr, byte_value)
+                    # Write the whole chunk in one bulk copy
+                    page_table.write_bytes(page_num * page_table.page_size, data_chunk)
                     
                     print(f"  Page {page_num}: Stored {len(data_chunk)} bytes")
                 
@@ -158,6 +154,9 @@ def file_operations_menu(ram, page_table):
                 
             except Exception as e:
                 print(f"Error storing file: {e}")
+            finally:
+                if isinstance(file_data, mmap.mmap):
+                    file_data.close()
         
         elif choice == 2:  # Retrieve file
             # Get file information
@@ -167,31 +166,25 @@ def file_operations_menu(ram, page_table):
             output_path = input("Enter output file path: ")
             
             try:
-                # Check if pages are allocated
-                for i in range(pages_count):
-                    page_num = starting_page + i
-                    info = page_table.get_page_info(page_num)
-                    if not info['present']:
-                        print(f"Error: Page {page_num} is not allocated. Cannot retrieve file.")
-                        input("\nPress Enter to continue...")
-                        return
+                # Check if pages are allocated, in one pass over the present bitmap
+                missing = np.flatnonzero((page_table.flags[starting_page:starting_page + pages_count] & PRESENT) == 0)
+                if missing.size:
+                    print(f"Error: Page {starting_page + int(missing[0])} is not allocated. Cannot retrieve file.")
+                    input("\nPress Enter to continue...")
+                    return
                 
-                # Retrieve file data
-                file_data = bytearray()
+                # Retrieve file data into a buffer sized for all pages up front
+                page_size = page_table.page_size
+                file_data = bytearray(pages_count * page_size)
+                buffer = memoryview(file_data)
                 
                 for i in range(pages_count):
                     page_num = starting_page + i
                     base_addr = page_num * page_table.page_size
                     
                     print(f"  Reading page {page_num}...")
-                    # Read page data
-                    for j in range(page_table.page_size):
-                        try:
-                            byte_value = page_table.read_byte(base_addr + j)
-                            file_data.append(byte_value)
-                        except Exception:
-                            # End of file or page
-                            break
+                    # Copy the whole page straight into its slice of the buffer
+                    page_table.read_into(base_addr, buffer[i * page_size:(i + 1) * page_size])
                 
                 # Write to output file
                 with open(output_path, 'wb') as f:
@@ -279,11 +272,7 @@ def display_page_table_range(page_table, start, end):
 
 def display_allocated_pages(page_table):
     """Display only allocated pages in the page table."""
-    allocated_pages = []
-    
-    for page_num in range(page_table.num_pages):
-        if page_table.table[page_num].present:
-            allocated_pages.append(page_num)
+    allocated_pages = page_table.allocated_page_indices().tolist()
     
     if not allocated_pages:
         print("\nNo pages are currently allocated.")
@@ -1,19 +1,46 @@
 """
 Memory allocation algorithms for file system simulator.
 
-This module implements First Fit, Best Fit, and Quick Fit algorithms
+This module implements First Fit, Best Fit, Quick Fit and Buddy algorithms
 for memory allocation in the virtual memory system.
 """
 
+import heapq
 import time
 from abc import ABC, abstractmethod
 from typing import List, Tuple, Optional, Dict
 import random
 
+import numpy as np
+
+from page_table import PRESENT
+
+# Allocations faster than this are too quick for their timing to mean anything
+TIMING_NOISE_FLOOR = 50e-6  # seconds
+
+
+def _efficiency_score(success: bool, fragmentation: float, execution_time: float) -> float:
+    """Calculate efficiency score based on fragmentation and execution time."""
+    if not success:
+        return 0.0
+    
+    # Lower fragmentation and faster execution = higher efficiency
+    fragmentation_penalty = fragmentation * 0.6
+    # Below the noise floor timing means nothing, so only fragmentation counts
+    if execution_time < TIMING_NOISE_FLOOR:
+        time_penalty = 0.0
+    else:
+        time_penalty = min(execution_time * 1000, 0.4)  # Convert to ms, cap at 0.4
+    
+    return max(0.0, 1.0 - fragmentation_penalty - time_penalty)
+
 
 class AllocationResult:
     """Represents the result of a memory allocation attempt."""
     
+    __slots__ = ('success', 'pages', 'algorithm', 'execution_time',
+                 'fragmentation', 'reason', 'efficiency_score')
+    
     def __init__(self, success: bool, pages: List[int] = None, 
                  algorithm: str = "", execution_time: float = 0.0,
                  fragmentation: float = 0.0, reason: str = ""):
@@ -23,18 +50,7 @@ class AllocationResult:
         self.execution_time = execution_time
         self.fragmentation = fragmentation
         self.reason = reason
-        self.efficiency_score = self._calculate_efficiency()
-    
-    def _calculate_efficiency(self) -> float:
-        """Calculate efficiency score based on fragmentation and execution time."""
-        if not self.success:
-            return 0.0
-        
-        # Lower fragmentation and faster execution = higher efficiency
-        fragmentation_penalty = self.fragmentation * 0.6
-        time_penalty = min(self.execution_time * 1000, 0.4)  # Convert to ms, cap at 0.4
-        
-        return max(0.0, 1.0 - fragmentation_penalty - time_penalty)
+        self.efficiency_score = _efficiency_score(success, fragmentation, execution_time)
 
 
 class MemoryAllocator(ABC):
@@ -43,106 +59,181 @@ class MemoryAllocator(ABC):
     def __init__(self, ram, page_table):
         self.ram = ram
         self.page_table = page_table
+        self._free_runs_cache = None
+        # When a list, _commit_allocation records what it overwrites so trials can be undone
+        self._undo_log: Optional[list] = None
+        # Reused by _commit_allocation to build page and frame ranges without new arrays
+        self._offsets = np.arange(ram.num_frames)
+        self._page_scratch = np.empty(ram.num_frames, dtype=np.int64)
+        self._frame_scratch = np.empty(ram.num_frames, dtype=np.int64)
     
     @abstractmethod
     def allocate(self, pages_needed: int) -> AllocationResult:
         """Allocate memory using the specific algorithm."""
         pass
     
-    def _find_contiguous_free_pages(self, pages_needed: int) -> Optional[List[int]]:
-        """Find contiguous free pages in the page table."""
-        for start_page in range(self.page_table.num_pages - pages_needed + 1):
-            # Check if pages_needed consecutive pages are free
-            contiguous = True
-            for i in range(pages_needed):
-                if self.page_table.table[start_page + i].present:
-                    contiguous = False
-                    break
-            
-            if contiguous:
-                return list(range(start_page, start_page + pages_needed))
-        
-        return None
+    def _find_free_page_run(self, pages_needed: int) -> Optional[int]:
+        """Find contiguous free pages in the page table; returns the first page or None."""
+        return self.page_table.find_free_run(pages_needed)
+    
+    def _free_frame_runs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Get arrays of start frames and sizes for each run of free frames."""
+        # Reuse the last scan until the frame table changes
+        cached = self._free_runs_cache
+        if cached is not None and cached[0] == self.ram.frame_version:
+            return cached[1], cached[2]
+        
+        # Frames below the RAM's hint are all allocated, so skip them
+        hint = self.ram.next_free_hint
+        free = ~np.asarray(self.ram.frame_table[hint:], dtype=np.bool_)
+        # +1 where a free run starts, -1 one past where it ends
+        edges = np.diff(np.concatenate(([0], free.view(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        sizes = np.flatnonzero(edges == -1) - starts
+        starts += hint
+        starts.setflags(write=False)
+        sizes.setflags(write=False)
+        self._free_runs_cache = (self.ram.frame_version, starts, sizes)
+        return starts, sizes
+    
+    def _commit_allocation(self, start_page: int, start_frame: int, count: int) -> List[int]:
+        """Map count contiguous pages onto contiguous frames and return the pages allocated."""
+        cached = self._free_runs_cache
+        if cached is not None and cached[0] != self.ram.frame_version:
+            cached = None
+        
+        offsets = self._offsets[:count]
+        pages = np.add(offsets, start_page, out=self._page_scratch[:count])
+        frames = np.add(offsets, start_frame, out=self._frame_scratch[:count])
+        end_frame = start_frame + count
+        if self._undo_log is not None:
+            self._undo_log.append((self.page_table.snapshot(pages), start_frame, end_frame))
+        self.ram.frame_table[start_frame:end_frame] = True
+        self.page_table.map_pages(pages, frames)
+        self.ram.frame_version += 1
+        
+        # Shrink the claimed run in the cached scan rather than rescanning later
+        if cached is not None:
+            _, starts, sizes = cached
+            block = int(np.searchsorted(starts, start_frame))
+            if block < starts.size and starts[block] == start_frame:
+                starts = starts.copy()
+                sizes = sizes.copy()
+                starts[block] += count
+                sizes[block] -= count
+                keep = sizes > 0
+                starts, sizes = starts[keep], sizes[keep]
+                starts.setflags(write=False)
+                sizes.setflags(write=False)
+                self._free_runs_cache = (self.ram.frame_version, starts, sizes)
+        if start_frame == self.ram.next_free_hint:
+            self.ram.next_free_hint = end_frame
+        return pages.tolist()
+    
+    def _allocate_single_page(self, algorithm: str, reason: str,
+                              start_time: int) -> Optional[AllocationResult]:
+        """Fast path for one page: take the first free frame and page, or None if either is missing."""
+        hint = self.ram.next_free_hint
+        free_frames = ~self.ram.frame_table[hint:]
+        frame_offset = int(np.argmax(free_frames)) if free_frames.size else 0
+        free_pages = (self.page_table.flags & PRESENT) == 0
+        page_num = int(np.argmax(free_pages))
+        if not free_frames.size or not free_frames[frame_offset] or not free_pages[page_num]:
+            return None
+        
+        allocated_pages = self._commit_allocation(page_num, hint + frame_offset, 1)
+        
+        execution_time = (time.perf_counter_ns() - start_time) * 1e-9
+        # With one page needed, only a completely full memory counts as fragmented
+        fragmentation = 0.0 if not self.ram.frame_table.all() else 1.0
+        return AllocationResult(
+            success=True,
+            pages=allocated_pages,
+            algorithm=algorithm,
+            execution_time=execution_time,
+            fragmentation=fragmentation,
+            reason=reason
+        )
     
     def get_free_frame_blocks(self) -> List[Tuple[int, int]]:
         """Get list of free frame blocks (start_frame, size)."""
-        blocks = []
-        current_start = None
-        current_size = 0
-        
-        for frame in range(self.ram.num_frames):
-            if not self.ram.frame_table[frame]:  # Free frame
-                if current_start is None:
-                    current_start = frame
-                    current_size = 1
-                else:
-                    current_size += 1
-            else:  # Allocated frame
-                if current_start is not None:
-                    blocks.append((current_start, current_size))
-                    current_start = None
-                    current_size = 0
-        
-        # Don't forget the last block if it ends with free frames
-        if current_start is not None:
-            blocks.append((current_start, current_size))
-        
-        return blocks
+        starts, sizes = self._free_frame_runs()
+        return list(zip(starts.tolist(), sizes.tolist()))
+    
+    def _scan_free(self, pages_needed: int) -> Tuple[np.ndarray, np.ndarray, Optional[int]]:
+        """Scan free frame runs and the first contiguous free page run once per allocation."""
+        starts, sizes = self._free_frame_runs()
+        return starts, sizes, self._find_free_page_run(pages_needed)
     
-    def calculate_fragmentation(self, pages_needed: int) -> float:
+    def calculate_fragmentation(self, pages_needed: int,
+                                free_sizes: Optional[np.ndarray] = None) -> float:
         """Calculate memory fragmentation after allocation."""
-        free_blocks = self.get_free_frame_blocks()
-        if not free_blocks:
-            return 1.0
+        if free_sizes is None:
+            free_sizes = self._free_frame_runs()[1]
         
-        total_free = sum(size for _, size in free_blocks)
+        total_free = int(free_sizes.sum())
         if total_free == 0:
             return 1.0
         
         # Fragmentation = (number of small unusable blocks) / total_free_space
-        unusable_space = sum(size for _, size in free_blocks if size < pages_needed)
-        return unusable_space / total_free if total_free > 0 else 0.0
+        unusable_space = int(free_sizes[free_sizes < pages_needed].sum())
+        return unusable_space / total_free
+    
+    def _fragmentation_after(self, sizes: np.ndarray, block: int, pages_needed: int) -> float:
+        """Calculate fragmentation once pages_needed frames are taken from free run `block`."""
+        remaining = sizes.copy()
+        remaining[block] -= pages_needed
+        return self.calculate_fragmentation(pages_needed, remaining[remaining > 0])
+
+
+def _first_fit_block(sizes: np.ndarray, pages_needed: int) -> int:
+    """Index of the first free run holding pages_needed frames, or -1."""
+    fits = np.flatnonzero(sizes >= pages_needed)
+    return int(fits[0]) if fits.size else -1
+
+
+def _best_fit_block(sizes: np.ndarray, pages_needed: int) -> int:
+    """Index of the smallest free run holding pages_needed frames (earliest on ties), or -1."""
+    fits = np.flatnonzero(sizes >= pages_needed)
+    if not fits.size:
+        return -1
+    return int(fits[np.argmin(sizes[fits])])
 
 
 class FirstFitAllocator(MemoryAllocator):
     """First Fit allocation algorithm - allocates in the first available block."""
     
     def allocate(self, pages_needed: int) -> AllocationResult:
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
-        free_blocks = self.get_free_frame_blocks()
+        if pages_needed == 1:
+            result = self._allocate_single_page(
+                "First Fit", "Fast allocation, may cause external fragmentation", start_time)
+            if result is not None:
+                return result
+        
+        starts, sizes, start_page = self._scan_free(pages_needed)
         
         # Find first block that can fit the required pages
-        for start_frame, size in free_blocks:
-            if size >= pages_needed:
-                # Find contiguous free pages
-                free_pages = self._find_contiguous_free_pages(pages_needed)
-                if free_pages is None:
-                    continue  # Try next block
-                
-                # Allocate contiguous pages to contiguous frames
-                allocated_pages = []
-                for i in range(pages_needed):
-                    page_num = free_pages[i]
-                    frame_num = start_frame + i
-                    self.ram.frame_table[frame_num] = True
-                    self.page_table.table[page_num].frame_number = frame_num
-                    self.page_table.table[page_num].present = True
-                    allocated_pages.append(page_num)
-                
-                execution_time = time.time() - start_time
-                fragmentation = self.calculate_fragmentation(pages_needed)
-                
-                return AllocationResult(
-                    success=True,
-                    pages=allocated_pages,
-                    algorithm="First Fit",
-                    execution_time=execution_time,
-                    fragmentation=fragmentation,
-                    reason="Fast allocation, may cause external fragmentation"
-                )
-        
-        execution_time = time.time() - start_time
+        block = _first_fit_block(sizes, pages_needed)
+        if block >= 0 and start_page is not None:
+            start_frame = int(starts[block])
+            
+            allocated_pages = self._commit_allocation(start_page, start_frame, pages_needed)
+            
+            execution_time = (time.perf_counter_ns() - start_time) * 1e-9
+            fragmentation = self._fragmentation_after(sizes, block, pages_needed)
+            
+            return AllocationResult(
+                success=True,
+                pages=allocated_pages,
+                algorithm="First Fit",
+                execution_time=execution_time,
+                fragmentation=fragmentation,
+                reason="Fast allocation, may cause external fragmentation"
+            )
+        
+        execution_time = (time.perf_counter_ns() - start_time) * 1e-9
         return AllocationResult(
             success=False,
             algorithm="First Fit",
@@ -155,15 +246,15 @@ class BestFitAllocator(MemoryAllocator):
     """Best Fit allocation algorithm - allocates in the smallest suitable block."""
     
     def allocate(self, pages_needed: int) -> AllocationResult:
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
-        free_blocks = self.get_free_frame_blocks()
+        starts, sizes, start_page = self._scan_free(pages_needed)
         
         # Find the smallest block that can fit the required pages
-        suitable_blocks = [(start, size) for start, size in free_blocks if size >= pages_needed]
+        block = _best_fit_block(sizes, pages_needed)
         
-        if not suitable_blocks:
-            execution_time = time.time() - start_time
+        if block < 0:
+            execution_time = (time.perf_counter_ns() - start_time) * 1e-9
             return AllocationResult(
                 success=False,
                 algorithm="Best Fit",
@@ -171,14 +262,10 @@ class BestFitAllocator(MemoryAllocator):
                 reason="No block large enough found"
             )
         
-        # Sort by size to find the best (smallest) fit
-        suitable_blocks.sort(key=lambda x: x[1])
-        start_frame, _ = suitable_blocks[0]
+        start_frame = int(starts[block])
         
-        # Find contiguous free pages
-        free_pages = self._find_contiguous_free_pages(pages_needed)
-        if free_pages is None:
-            execution_time = time.time() - start_time
+        if start_page is None:
+            execution_time = (time.perf_counter_ns() - start_time) * 1e-9
             return AllocationResult(
                 success=False,
                 algorithm="Best Fit",
@@ -186,18 +273,10 @@ class BestFitAllocator(MemoryAllocator):
                 reason="No contiguous pages available"
             )
         
-        # Allocate contiguous pages to contiguous frames
-        allocated_pages = []
-        for i in range(pages_needed):
-            page_num = free_pages[i]
-            frame_num = start_frame + i
-            self.ram.frame_table[frame_num] = True
-            self.page_table.table[page_num].frame_number = frame_num
-            self.page_table.table[page_num].present = True
-            allocated_pages.append(page_num)
-        
-        execution_time = time.time() - start_time
-        fragmentation = self.calculate_fragmentation(pages_needed)
+        allocated_pages = self._commit_allocation(start_page, start_frame, pages_needed)
+        
+        execution_time = (time.perf_counter_ns() - start_time) * 1e-9
+        fragmentation = self._fragmentation_after(sizes, block, pages_needed)
         
         return AllocationResult(
             success=True,
@@ -215,51 +294,55 @@ class QuickFitAllocator(MemoryAllocator):
     def __init__(self, ram, page_table):
         super().__init__(ram, page_table)
         # Common sizes for quick allocation (in pages)
-        self.quick_lists = {1: [], 2: [], 4: [], 8: [], 16: []}
+        self.quick_lists = {size: np.empty(0, dtype=np.intp) for size in (1, 2, 4, 8, 16)}
+        self._quick_lists_version = None
         self._update_quick_lists()
     
-    def _update_quick_lists(self):
+    def _update_quick_lists(self, starts: Optional[np.ndarray] = None,
+                            sizes: Optional[np.ndarray] = None):
         """Update quick lists with current free blocks."""
+        if starts is None:
+            starts, sizes = self._free_frame_runs()
+        self._quick_lists_version = self.ram.frame_version
+        # Each list holds, in frame order, the start of every block at least that size
         for size in self.quick_lists:
-            self.quick_lists[size] = []
-        
-        free_blocks = self.get_free_frame_blocks()
-        for start_frame, block_size in free_blocks:
-            if block_size in self.quick_lists:
-                self.quick_lists[block_size].append(start_frame)
-            # Also add to smaller size lists if block is larger
-            for size in self.quick_lists:
-                if size <= block_size and start_frame not in self.quick_lists[size]:
-                    self.quick_lists[size].append(start_frame)
+            self.quick_lists[size] = starts[sizes >= size]
     
     def allocate(self, pages_needed: int) -> AllocationResult:
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
-        self._update_quick_lists()
+        if pages_needed == 1:
+            result = self._allocate_single_page(
+                "Quick Fit", "Fast allocation for common sizes, good for frequent allocations", start_time)
+            if result is not None:
+                return result
+        
+        starts, sizes, start_page = self._scan_free(pages_needed)
+        # Only rebuild when the frames changed since the lists were last built
+        if self._quick_lists_version != self.ram.frame_version:
+            self._update_quick_lists(starts, sizes)
         
         # Try to find in quick lists first
         start_frame = None
         
         # Check exact size first
-        if pages_needed in self.quick_lists and self.quick_lists[pages_needed]:
-            start_frame = self.quick_lists[pages_needed][0]
+        if pages_needed in self.quick_lists and self.quick_lists[pages_needed].size:
+            start_frame = int(self.quick_lists[pages_needed][0])
         else:
             # Find smallest suitable size
             for size in sorted(self.quick_lists.keys()):
-                if size >= pages_needed and self.quick_lists[size]:
-                    start_frame = self.quick_lists[size][0]
+                if size >= pages_needed and self.quick_lists[size].size:
+                    start_frame = int(self.quick_lists[size][0])
                     break
         
         # If not found in quick lists, fall back to first fit
         if start_frame is None:
-            free_blocks = self.get_free_frame_blocks()
-            for start, size in free_blocks:
-                if size >= pages_needed:
-                    start_frame = start
-                    break
+            block = _first_fit_block(sizes, pages_needed)
+            if block >= 0:
+                start_frame = int(starts[block])
         
         if start_frame is None:
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_time) * 1e-9
             return AllocationResult(
                 success=False,
                 algorithm="Quick Fit",
@@ -267,10 +350,8 @@ class QuickFitAllocator(MemoryAllocator):
                 reason="No suitable block found"
             )
         
-        # Find contiguous free pages
-        free_pages = self._find_contiguous_free_pages(pages_needed)
-        if free_pages is None:
-            execution_time = time.time() - start_time
+        if start_page is None:
+            execution_time = (time.perf_counter_ns() - start_time) * 1e-9
             return AllocationResult(
                 success=False,
                 algorithm="Quick Fit",
@@ -278,18 +359,11 @@ class QuickFitAllocator(MemoryAllocator):
                 reason="No contiguous pages available"
             )
         
-        # Allocate contiguous pages to contiguous frames
-        allocated_pages = []
-        for i in range(pages_needed):
-            page_num = free_pages[i]
-            frame_num = start_frame + i
-            self.ram.frame_table[frame_num] = True
-            self.page_table.table[page_num].frame_number = frame_num
-            self.page_table.table[page_num].present = True
-            allocated_pages.append(page_num)
-        
-        execution_time = time.time() - start_time
-        fragmentation = self.calculate_fragmentation(pages_needed)
+        allocated_pages = self._commit_allocation(start_page, start_frame, pages_needed)
+        
+        execution_time = (time.perf_counter_ns() - start_time) * 1e-9
+        block = int(np.searchsorted(starts, start_frame))
+        fragmentation = self._fragmentation_after(sizes, block, pages_needed)
         
         return AllocationResult(
             success=True,
@@ -301,6 +375,89 @@ class QuickFitAllocator(MemoryAllocator):
         )
 
 
+class BuddyFitAllocator(MemoryAllocator):
+    """Buddy allocation algorithm - serves requests from power-of-two blocks split on demand."""
+    
+    def __init__(self, ram, page_table):
+        super().__init__(ram, page_table)
+        self.max_order = max(0, (ram.num_frames - 1).bit_length())
+        # Min-heaps of start frames of free, aligned 2**order blocks, keyed by order
+        self.free_lists: Dict[int, List[int]] = {order: [] for order in range(self.max_order + 1)}
+        self._free_lists_version = None
+        self._rebuild_free_lists()
+    
+    def _add_free_range(self, start: int, end: int):
+        """Split frames [start, end) into maximal aligned buddy blocks and add them to the free lists."""
+        while start < end:
+            align = (start & -start).bit_length() - 1 if start else self.max_order
+            order = min(align, (end - start).bit_length() - 1)
+            heapq.heappush(self.free_lists[order], start)
+            start += 1 << order
+    
+    def _rebuild_free_lists(self):
+        """Rebuild the free lists from the frame table."""
+        # Frames freed by anyone coalesce here, since each free run is re-split from scratch
+        for order in self.free_lists:
+            self.free_lists[order] = []
+        starts, sizes = self._free_frame_runs()
+        for start, size in zip(starts.tolist(), sizes.tolist()):
+            self._add_free_range(start, start + size)
+        self._free_lists_version = self.ram.frame_version
+    
+    def allocate(self, pages_needed: int) -> AllocationResult:
+        start_time = time.perf_counter_ns()
+        
+        if self._free_lists_version != self.ram.frame_version:
+            self._rebuild_free_lists()
+        
+        # Round the request up to the next power of two
+        order = (max(pages_needed, 1) - 1).bit_length()
+        block_order = next((k for k in range(order, self.max_order + 1) if self.free_lists[k]), None)
+        
+        if block_order is None:
+            execution_time = (time.perf_counter_ns() - start_time) * 1e-9
+            return AllocationResult(
+                success=False,
+                algorithm="Buddy",
+                execution_time=execution_time,
+                reason="No buddy block large enough found"
+            )
+        
+        start_page = self._find_free_page_run(pages_needed)
+        if start_page is None:
+            execution_time = (time.perf_counter_ns() - start_time) * 1e-9
+            return AllocationResult(
+                success=False,
+                algorithm="Buddy",
+                execution_time=execution_time,
+                reason="No contiguous pages available"
+            )
+        
+        # Split the block down to the requested order, returning upper halves
+        start_frame = heapq.heappop(self.free_lists[block_order])
+        while block_order > order:
+            block_order -= 1
+            heapq.heappush(self.free_lists[block_order], start_frame + (1 << block_order))
+        
+        allocated_pages = self._commit_allocation(start_page, start_frame, pages_needed)
+        
+        # Frames of the block the request did not use stay free in RAM
+        self._add_free_range(start_frame + len(allocated_pages), start_frame + (1 << order))
+        self._free_lists_version = self.ram.frame_version
+        
+        execution_time = (time.perf_counter_ns() - start_time) * 1e-9
+        fragmentation = self.calculate_fragmentation(pages_needed)
+        
+        return AllocationResult(
+            success=True,
+            pages=allocated_pages,
+            algorithm="Buddy",
+            execution_time=execution_time,
+            fragmentation=fragmentation,
+            reason="Power-of-two blocks make splitting and merging cheap, at some internal waste"
+        )
+
+
 class AllocationComparator:
     """Compares different allocation algorithms and recommends the best one."""
     
@@ -310,40 +467,33 @@ class AllocationComparator:
         self.allocators = {
             "First Fit": FirstFitAllocator(ram, page_table),
             "Best Fit": BestFitAllocator(ram, page_table),
-            "Quick Fit": QuickFitAllocator(ram, page_table)
+            "Quick Fit": QuickFitAllocator(ram, page_table),
+            "Buddy": BuddyFitAllocator(ram, page_table)
         }
     
     def compare_algorithms(self, pages_needed: int) -> Dict[str, AllocationResult]:
         """Compare all algorithms without actually allocating memory."""
         results = {}
         
-        # Save current state
-        original_frame_table = self.ram.frame_table.copy()
-        original_page_table = [
-            {
-                'frame_number': entry.frame_number,
-                'present': entry.present,
-                'referenced': entry.referenced,
-                'modified': entry.modified,
-                'read_only': entry.read_only
-            }
-            for entry in self.page_table.table
-        ]
+        # Save the counters; trials log the few frames and pages they overwrite
+        original_hint = self.ram.next_free_hint
+        original_counters = self.page_table.snapshot(())
         
         for name, allocator in self.allocators.items():
             # Test allocation
-            result = allocator.allocate(pages_needed)
-            results[name] = result
-            
-            # Restore original state for next test
-            self.ram.frame_table = original_frame_table.copy()
-            for i, orig_entry in enumerate(original_page_table):
-                entry = self.page_table.table[i]
-                entry.frame_number = orig_entry['frame_number']
-                entry.present = orig_entry['present']
-                entry.referenced = orig_entry['referenced']
-                entry.modified = orig_entry['modified']
-                entry.read_only = orig_entry['read_only']
+            allocator._undo_log = undo_log = []
+            try:
+                results[name] = allocator.allocate(pages_needed)
+            finally:
+                allocator._undo_log = None
+                
+                # Restore original state for next test, touching only what the trial changed
+                for pages_snapshot, start_frame, end_frame in reversed(undo_log):
+                    self.ram.frame_table[start_frame:end_frame] = False
+                    self.page_table.restore(pages_snapshot)
+                self.page_table.restore(original_counters)
+                self.ram.frame_version += 1
+                self.ram.next_free_hint = original_hint
         
         return results
     
@@ -1,8 +1,19 @@
 import streamlit as st
-import matplotlib.pyplot as plt
-import matplotlib.colors as mcolors
 import numpy as np
 
+# Rows drawn per memory strip; larger spaces are averaged into this many bins
+MAP_ROWS = 100
+
+
+def _usage_strip(used, rows=MAP_ROWS):
+    """Average a per-unit usage array into at most `rows` bins; returns (strip, units per bin)."""
+    used = np.asarray(used, dtype=np.float32)
+    width = max(1, -(-used.size // rows))
+    starts = np.arange(0, used.size, width)
+    counts = np.diff(np.append(starts, used.size))
+    return (np.add.reduceat(used, starts) / counts).reshape(-1, 1), width
+
+
 def display_memory_map(page_table, ram):
     """
     Display a visual memory map showing the relationship between
@@ -12,6 +23,10 @@ def display_memory_map(page_table, ram):
         page_table: The page table instance
         ram: The RAM instance
     """
+    import matplotlib.pyplot as plt
+    import matplotlib.colors as mcolors
+    from matplotlib.collections import LineCollection
+    
     st.subheader("Memory Map Visualization")
     
     # Create figure with two subplots side by side
@@ -20,80 +35,57 @@ def display_memory_map(page_table, ram):
     # Define color map
     cmap = mcolors.LinearSegmentedColormap.from_list("", ["#f8f9fa", "#17a2b8", "#dc3545"])
     
-    # Prepare data for visualization
-    max_pages_to_show = min(page_table.num_pages, 100)  # Limit for visualization
-    max_frames_to_show = min(ram.num_frames, 100)  # Limit for visualization
+    # Whole address spaces, averaged into at most MAP_ROWS rows of usage density
+    virtual_mem, pages_per_row = _usage_strip(page_table.present)
+    physical_mem, frames_per_row = _usage_strip(ram.frame_table)
+    page_rows = len(virtual_mem)
+    frame_rows = len(physical_mem)
     
-    # Create virtual memory map
-    virtual_mem = np.zeros((max_pages_to_show, 1))
-    physical_mem = np.zeros((max_frames_to_show, 1))
-    
-    # Track which pages are mapped to which frames
-    page_to_frame = {}
-    
-    # Fill in the mapping data
-    for page_num in range(max_pages_to_show):
-        entry = page_table.table[page_num]
-        if entry.present and entry.frame_number is not None:
-            virtual_mem[page_num] = 1
-            
-            # Record the mapping
-            if entry.frame_number < max_frames_to_show:
-                physical_mem[entry.frame_number] = 1
-                page_to_frame[page_num] = entry.frame_number
+    # Which pages are mapped to which frames, straight from the page table arrays
+    mapped_pages = np.flatnonzero(page_table.present & (page_table.frame_numbers >= 0))
+    mapped_frames = page_table.frame_numbers[mapped_pages]
     
     # Plot virtual memory
-    ax1.imshow(virtual_mem, cmap=cmap, aspect='auto')
+    ax1.imshow(virtual_mem, cmap=cmap, aspect='auto', vmin=0, vmax=1)
     ax1.set_title('Virtual Address Space')
     ax1.set_ylabel('Page Number')
-    ax1.set_yticks(range(0, max_pages_to_show, 5))
-    ax1.set_yticklabels(range(0, max_pages_to_show, 5))
+    ax1.set_yticks(range(0, page_rows, 5))
+    ax1.set_yticklabels(range(0, page_rows * pages_per_row, 5 * pages_per_row))
     ax1.set_xticks([])
     
     # Plot physical memory
-    ax2.imshow(physical_mem, cmap=cmap, aspect='auto')
+    ax2.imshow(physical_mem, cmap=cmap, aspect='auto', vmin=0, vmax=1)
     ax2.set_title('Physical Memory')
     ax2.set_ylabel('Frame Number')
-    ax2.set_yticks(range(0, max_frames_to_show, 5))
-    ax2.set_yticklabels(range(0, max_frames_to_show, 5))
+    ax2.set_yticks(range(0, frame_rows, 5))
+    ax2.set_yticklabels(range(0, frame_rows * frames_per_row, 5 * frames_per_row))
     ax2.set_xticks([])
     
-    # Draw arrows connecting pages to frames
-    for page, frame in page_to_frame.items():
-        # Skip if out of visualization range
-        if page >= max_pages_to_show or frame >= max_frames_to_show:
-            continue
-            
-        # Calculate arrow coordinates
-        x_start = 0
-        y_start = page
-        x_end = 0
-        y_end = frame
-        
-        # Draw arrow
-        ax1.annotate("", 
-                    xy=(x_start + 1, y_start),
-                    xytext=(x_start + 0.6, y_start),
-                    arrowprops=dict(arrowstyle="->", color="gray", lw=0.5))
-        
-        ax2.annotate("", 
-                    xy=(x_end - 0.1, y_end),
-                    xytext=(x_end - 0.6, y_end),
-                    arrowprops=dict(arrowstyle="->", color="gray", lw=0.5))
-        
-        # Add connecting line in the middle
-        fig.lines = [plt.Line2D([0.49, 0.51], 
-                              [0.1 + 0.8 * page / max_pages_to_show, 0.1 + 0.8 * frame / max_frames_to_show],
-                              transform=fig.transFigure, color="gray", linestyle="--", lw=0.5)]
+    # Draw every page-to-frame link as one collection per axis rather than an artist per link
+    pages = mapped_pages / pages_per_row
+    frames = mapped_frames / frames_per_row
+    
+    def _segments(x_start, x_end, y_start, y_end):
+        return np.stack([np.column_stack([np.full_like(y_start, x_start), y_start]),
+                         np.column_stack([np.full_like(y_end, x_end), y_end])], axis=1)
+    
+    ax1.add_collection(LineCollection(_segments(0.6, 1, pages, pages), colors="gray", linewidths=0.5), autolim=False)
+    ax2.add_collection(LineCollection(_segments(-0.6, -0.1, frames, frames), colors="gray", linewidths=0.5), autolim=False)
+    
+    # Connecting lines in the middle, in figure coordinates
+    fig.add_artist(LineCollection(
+        _segments(0.49, 0.51, 0.1 + 0.8 * pages / page_rows, 0.1 + 0.8 * frames / frame_rows),
+        transform=fig.transFigure, colors="gray", linestyles="--", linewidths=0.5))
     
     # Add labels for clarity
-    ax1.text(-0.2, max_pages_to_show/2, "Virtual Memory", rotation=90, 
+    ax1.text(-0.2, page_rows/2, "Virtual Memory", rotation=90, 
              ha='center', va='center', fontsize=12, fontweight='bold')
-    ax2.text(1.2, max_frames_to_show/2, "Physical Memory", rotation=90, 
+    ax2.text(1.2, frame_rows/2, "Physical Memory", rotation=90, 
              ha='center', va='center', fontsize=12, fontweight='bold')
     
     plt.tight_layout()
     st.pyplot(fig)
+    plt.close(fig)
     
     # Display statistics
     st.subheader("Memory Utilization")
@@ -101,11 +93,13 @@ def display_memory_map(page_table, ram):
     col1, col2 = st.columns(2)
     
     with col1:
+        present_pages = page_table.flag_counts['present']
         st.metric("Virtual Pages Allocated", 
-                  f"{sum(1 for e in page_table.table if e.present)} / {page_table.num_pages}",
-                  f"{(sum(1 for e in page_table.table if e.present) / page_table.num_pages) * 100:.1f}%")
+                  f"{present_pages} / {page_table.num_pages}",
+                  f"{(present_pages / page_table.num_pages) * 100:.1f}%")
     
     with col2:
+        used_frames = int(np.count_nonzero(ram.frame_table))
         st.metric("Physical Frames Used", 
-                  f"{ram.frame_table.count(True)} / {ram.num_frames}",
-                  f"{(ram.frame_table.count(True) / ram.num_frames) * 100:.1f}%")
\ No newline at end of file
+                  f"{used_frames} / {ram.num_frames}",
+                  f"{(used_frames / ram.num_frames) * 100:.1f}%")
\ No newline at end of file
@@ -1,49 +1,136 @@
+import operator
+from collections.abc import Sequence
+
+import numpy as np
+
+
+# Bits of PageTable.flags
+PRESENT = 1
+REFERENCED = 2
+MODIFIED = 4
+READ_ONLY = 8
+
+_FLAG_NAMES = {PRESENT: 'present', REFERENCED: 'referenced',
+               MODIFIED: 'modified', READ_ONLY: 'read_only'}
+
+# Status text of PageTableEntry.__str__ for each of the 16 possible flag bytes
+_STATUS_LABELS = ((PRESENT, "Present"), (REFERENCED, "Referenced"),
+                  (MODIFIED, "Modified"), (READ_ONLY, "ReadOnly"))
+_STATUS_STRS = [", ".join(label for bit, label in _STATUS_LABELS if flags & bit) or "Not Present"
+                for flags in range(16)]
+
+# For each flag bit, which of the 16 possible flag bytes have it set
+_FLAG_BYTES_WITH = {bit: (np.arange(16) & bit) != 0 for bit in _FLAG_NAMES}
+
+
 class PageTableEntry:
     """
-    Represents a single entry in a page table, mapping a virtual page to a physical frame.
+    A view of a single entry in a page table, mapping a virtual page to a physical frame.
+    
+    The entry holds no state of its own; every attribute reads and writes the
+    owning PageTable's packed flags and frame number arrays.
     
     Attributes:
-        frame_number (int): The physical frame number this page maps to.
+        frame_number (int): The physical frame number this page maps to, or None.
         present (bool): Whether this page is currently in physical memory.
         referenced (bool): Whether this page has been accessed recently.
         modified (bool): Whether this page has been modified (dirty bit).
         read_only (bool): Whether this page is read-only.
     """
     
-    def __init__(self, frame_number=None, present=False, referenced=False, 
-                 modified=False, read_only=False):
+    __slots__ = ('_page_table', '_page_number')
+    
+    def __init__(self, page_table, page_number):
         """
-        Initialize a page table entry.
+        Initialize a view of one page table entry.
         
         Args:
-            frame_number (int, optional): Physical frame number. None if not mapped.
-            present (bool): Whether the page is in physical memory.
-            referenced (bool): Whether the page was recently accessed.
-            modified (bool): Whether the page was modified since loaded.
-            read_only (bool): Whether the page is read-only.
-        """
-        self.frame_number = frame_number
-        self.present = present
-        self.referenced = referenced
-        self.modified = modified
-        self.read_only = read_only
+            page_table (PageTable): The page table that owns the entry.
+            page_number (int): The virtual page number of the entry.
+        """
+        self._page_table = page_table
+        self._page_number = page_number
+    
+    @property
+    def frame_number(self):
+        frame_number = int(self._page_table.frame_numbers[self._page_number])
+        return frame_number if frame_number >= 0 else None
+    
+    @frame_number.setter
+    def frame_number(self, value):
+        page_table = self._page_table
+        frame_number = -1 if value is None else value
+        page_table.frame_numbers[self._page_number] = frame_number
+        page_table.frame_base[self._page_number] = (
+            frame_number << page_table._page_shift if frame_number >= 0 else -1)
+        # Remapping invalidates cached translations and version-keyed views
+        page_table.version += 1
+        page_table._tlb = (-1, -1, 0)
+    
+    @property
+    def present(self):
+        return bool(self._page_table.flags[self._page_number] & PRESENT)
+    
+    @present.setter
+    def present(self, value):
+        self._page_table._set_flag(self._page_number, PRESENT, value)
+    
+    @property
+    def referenced(self):
+        return bool(self._page_table.flags[self._page_number] & REFERENCED)
+    
+    @referenced.setter
+    def referenced(self, value):
+        self._page_table._set_flag(self._page_number, REFERENCED, value)
+    
+    @property
+    def modified(self):
+        return bool(self._page_table.flags[self._page_number] & MODIFIED)
+    
+    @modified.setter
+    def modified(self, value):
+        self._page_table._set_flag(self._page_number, MODIFIED, value)
+    
+    @property
+    def read_only(self):
+        return bool(self._page_table.flags[self._page_number] & READ_ONLY)
+    
+    @read_only.setter
+    def read_only(self, value):
+        self._page_table._set_flag(self._page_number, READ_ONLY, value)
     
     def __str__(self):
         """Return a string representation of the page table entry."""
-        status = []
-        if self.present:
-            status.append("Present")
-        if self.referenced:
-            status.append("Referenced")
-        if self.modified:
-            status.append("Modified")
-        if self.read_only:
-            status.append("ReadOnly")
-        
-        status_str = ", ".join(status) if status else "Not Present"
+        status_str = _STATUS_STRS[self._page_table.flags[self._page_number] & 0xF]
         return f"Frame: {self.frame_number if self.frame_number is not None else 'None'}, Status: {status_str}"
 
 
+class PageTableEntries(Sequence):
+    """
+    Read-only sequence of PageTableEntry views over a page table.
+    
+    Views are created on access, so no per-page objects are kept alive.
+    """
+    
+    __slots__ = ('_page_table',)
+    
+    def __init__(self, page_table):
+        self._page_table = page_table
+    
+    def __len__(self):
+        return self._page_table.num_pages
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [PageTableEntry(self._page_table, i) for i in range(*index.indices(len(self)))]
+        index = operator.index(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("page table index out of range")
+        return PageTableEntry(self._page_table, index)
+
+
 class PageTable:
     """
     Manages virtual-to-physical address translation using a page table structure.
@@ -55,7 +142,16 @@ class PageTable:
         page_size (int): Size of each page in bytes.
         address_space_size (int): Size of the virtual address space in bytes.
         num_pages (int): Total number of pages in the virtual address space.
-        table (list): List of PageTableEntry objects representing the page table.
+        table (PageTableEntries): PageTableEntry views, one per page, created on access.
+        flags (numpy.ndarray): uint8 per page packing the PRESENT, REFERENCED,
+            MODIFIED and READ_ONLY bits.
+        frame_numbers (numpy.ndarray): int32 frame number of each page, -1 if unmapped.
+        frame_base (numpy.ndarray): int64 physical address of each page's frame,
+            precomputed from frame_numbers; -1 if unmapped.
+        flag_counts (dict): Running number of entries with each flag set, keyed by
+            'present', 'referenced', 'modified' and 'read_only'.
+        version (int): Counter bumped whenever a page is mapped or unmapped or one
+            of its referenced/modified bits changes.
         ram (RAM): Reference to the RAM object used for physical memory operations.
     """
     
@@ -67,14 +163,78 @@ class PageTable:
             ram (RAM): Reference to the RAM object for physical memory.
             address_space_size (int): Size of virtual address space in bytes. Default is 16MB.
             page_size (int): Size of each page in bytes. Default is 4KB.
+            
+        Raises:
+            ValueError: If page_size is not a power of two.
         """
+        if page_size <= 0 or page_size & (page_size - 1):
+            raise ValueError(f"Page size {page_size} is not a power of two")
+        
         self.page_size = page_size
+        # Page number and offset are a shift and a mask of the address
+        self._page_shift = page_size.bit_length() - 1
+        self._page_mask = page_size - 1
         self.address_space_size = address_space_size
         self.num_pages = address_space_size // page_size
         self.ram = ram
         
-        # Initialize empty page table
-        self.table = [PageTableEntry() for _ in range(self.num_pages)]
+        # Page state lives in two flat arrays; entries are views onto them
+        self.flags = np.zeros(self.num_pages, dtype=np.uint8)
+        self.frame_numbers = np.full(self.num_pages, -1, dtype=np.int32)
+        self.frame_base = np.full(self.num_pages, -1, dtype=np.int64)
+        self.table = PageTableEntries(self)
+        self.version = 0
+        
+        # Kept in step with flags so get_table_statistics needs no scan
+        self.flag_counts = {'present': 0, 'referenced': 0, 'modified': 0, 'read_only': 0}
+        
+        # One-entry translation cache: (version it was filled at, page, frame base address)
+        self._tlb = (-1, -1, 0)
+        
+        # Page numbers with PRESENT set, maintained alongside flags for page replacement
+        self._present_pages = set()
+    
+    @property
+    def present(self):
+        """
+        uint8 bitmap of each page's present bit, computed from flags.
+        
+        Returns:
+            numpy.ndarray: 1 for present pages, 0 otherwise.
+        """
+        return self.flags & PRESENT
+    
+    def _set_flag(self, page_number, bit, value):
+        """Set or clear one flag bit of a page, keeping flag_counts and version in step."""
+        old = int(self.flags[page_number])
+        new = old | bit if value else old & ~bit
+        if new != old:
+            self.flags[page_number] = new
+            self.flag_counts[_FLAG_NAMES[bit]] += 1 if value else -1
+            self.version += 1
+            if bit == PRESENT:
+                if value:
+                    self._present_pages.add(int(page_number))
+                else:
+                    self._present_pages.discard(int(page_number))
+    
+    def _uncount_flag_array(self, flags):
+        """Remove many pages' set flags from flag_counts, tallying every bit in one pass."""
+        histogram = np.bincount(flags & 0xF, minlength=16)
+        for bit, name in _FLAG_NAMES.items():
+            self.flag_counts[name] -= int(histogram[_FLAG_BYTES_WITH[bit]].sum())
+    
+    def _refresh_frame_base(self, pages):
+        """Recompute frame_base for the given pages from their frame numbers."""
+        frame_numbers = self.frame_numbers[pages].astype(np.int64)
+        self.frame_base[pages] = np.where(frame_numbers >= 0, frame_numbers << self._page_shift, -1)
+    
+    def _uncount_flags(self, flags):
+        """Remove a page's set flags from flag_counts before they are overwritten."""
+        counts = self.flag_counts
+        for bit, name in _FLAG_NAMES.items():
+            if flags & bit:
+                counts[name] -= 1
     
     def get_page_number(self, virtual_address):
         """
@@ -92,7 +252,7 @@ class PageTable:
         if not 0 <= virtual_address < self.address_space_size:
             raise IndexError(f"Virtual address {virtual_address} out of bounds")
             
-        return virtual_address // self.page_size
+        return virtual_address >> self._page_shift
     
     def get_offset(self, virtual_address):
         """
@@ -104,7 +264,7 @@ class PageTable:
         Returns:
             int: The offset within the page.
         """
-        return virtual_address % self.page_size
+        return virtual_address & self._page_mask
     
     def translate_address(self, virtual_address):
         """
@@ -120,20 +280,104 @@ class PageTable:
             MemoryError: If the page is not present in physical memory.
             IndexError: If the address is outside the virtual address space.
         """
-        page_number = self.get_page_number(virtual_address)
-        offset = self.get_offset(virtual_address)
+        # Consecutive accesses usually hit the same page; reuse its translation
+        tlb_version, tlb_page, tlb_frame_base = self._tlb
+        if virtual_address >> self._page_shift == tlb_page and tlb_version == self.version:
+            return tlb_frame_base | (virtual_address & self._page_mask)
         
-        entry = self.table[page_number]
+        if not 0 <= virtual_address < self.address_space_size:
+            raise IndexError(f"Virtual address {virtual_address} out of bounds")
+        page_number = virtual_address >> self._page_shift
+        offset = virtual_address & self._page_mask
         
-        if not entry.present or entry.frame_number is None:
+        flags = int(self.flags[page_number])
+        frame_base = int(self.frame_base[page_number])
+        
+        if not flags & PRESENT or frame_base < 0:
             raise MemoryError(f"Page {page_number} is not present in physical memory")
         
         # Mark the page as referenced
-        entry.referenced = True
+        if not flags & REFERENCED:
+            self._set_flag(page_number, REFERENCED, True)
         
-        # Calculate the physical address
-        physical_address = (entry.frame_number * self.page_size) + offset
-        return physical_address
+        self._tlb = (self.version, page_number, frame_base)
+        return frame_base | offset
+    
+    def _translate_for_write(self, virtual_address):
+        """Bounds-, read-only- and presence-check a write, mark the page and return its physical address."""
+        if not 0 <= virtual_address < self.address_space_size:
+            raise IndexError(f"Virtual address {virtual_address} out of bounds")
+        page_number = virtual_address >> self._page_shift
+        
+        flags = int(self.flags[page_number])
+        if flags & READ_ONLY:
+            raise ValueError(f"Cannot write to read-only page {page_number}")
+        frame_base = int(self.frame_base[page_number])
+        if not flags & PRESENT or frame_base < 0:
+            raise MemoryError(f"Page {page_number} is not present in physical memory")
+        
+        # Mark the page as referenced and modified
+        if flags & (REFERENCED | MODIFIED) != REFERENCED | MODIFIED:
+            self.flags[page_number] = flags | REFERENCED | MODIFIED
+            if not flags & REFERENCED:
+                self.flag_counts['referenced'] += 1
+            if not flags & MODIFIED:
+                self.flag_counts['modified'] += 1
+            self.version += 1
+        
+        self._tlb = (self.version, page_number, frame_base)
+        return frame_base | (virtual_address & self._page_mask)
+    
+    def access_page_batch(self, virtual_addresses, is_write=False):
+        """
+        Translate many virtual addresses at once, as a trace of memory accesses.
+        
+        The referenced (and for writes, modified) bits of every touched page are
+        OR'ed into flags with one array operation instead of one call per access.
+        
+        Args:
+            virtual_addresses (array-like): The virtual addresses accessed.
+            is_write (bool): Whether the accesses are writes.
+            
+        Returns:
+            numpy.ndarray: int64 physical address for each virtual address.
+            
+        Raises:
+            MemoryError: If any accessed page is not present in physical memory.
+            ValueError: If is_write and any accessed page is read-only.
+            IndexError: If any address is outside the virtual address space.
+        """
+        addresses = np.asarray(virtual_addresses, dtype=np.int64)
+        if not addresses.size:
+            return np.empty(0, dtype=np.int64)
+        if addresses.min() < 0 or addresses.max() >= self.address_space_size:
+            bad = addresses[(addresses < 0) | (addresses >= self.address_space_size)][0]
+            raise IndexError(f"Virtual address {bad} out of bounds")
+        
+        pages = np.unique(addresses >> self._page_shift)
+        flags = self.flags[pages]
+        missing = pages[(flags & PRESENT) == 0]
+        if missing.size:
+            raise MemoryError(f"Page {missing[0]} is not present in physical memory")
+        
+        bits = REFERENCED
+        if is_write:
+            read_only = pages[(flags & READ_ONLY) != 0]
+            if read_only.size:
+                raise ValueError(f"Cannot write to read-only page {read_only[0]}")
+            bits |= MODIFIED
+        
+        changed = False
+        for bit in (REFERENCED, MODIFIED):
+            if bits & bit:
+                newly_set = int(np.count_nonzero((flags & bit) == 0))
+                self.flag_counts[_FLAG_NAMES[bit]] += newly_set
+                changed |= newly_set > 0
+        if changed:
+            self.flags[pages] = flags | bits
+            self.version += 1
+        
+        return self.frame_base[addresses >> self._page_shift] | (addresses & self._page_mask)
     
     def read_byte(self, virtual_address):
         """
@@ -163,18 +407,100 @@ class PageTable:
             MemoryError: If the page is not present in physical memory.
             ValueError: If the page is read-only.
         """
-        page_number = self.get_page_number(virtual_address)
-        entry = self.table[page_number]
+        physical_address = self._translate_for_write(virtual_address)
+        self.ram.write_byte(physical_address, value)
+    
+    def read_bytes(self, virtual_address, length):
+        """
+        Read a run of bytes starting at a virtual address.
         
-        if entry.read_only:
-            raise ValueError(f"Cannot write to read-only page {page_number}")
+        The address is translated once per page touched rather than once per byte.
+        
+        Args:
+            virtual_address (int): The virtual address to start reading from.
+            length (int): Number of bytes to read.
             
-        physical_address = self.translate_address(virtual_address)
+        Returns:
+            bytes: The bytes stored at the requested virtual range.
+            
+        Raises:
+            MemoryError: If any page in the range is not present in physical memory.
+            IndexError: If the range is outside the virtual address space.
+        """
+        if length <= 0:
+            return b""
+        self.get_page_number(virtual_address + length - 1)
+        
+        chunks = []
+        while length > 0:
+            offset = self.get_offset(virtual_address)
+            n = min(length, self.page_size - offset)
+            physical_address = self.translate_address(virtual_address)
+            chunks.append(self.ram.read_bytes(physical_address, n))
+            virtual_address += n
+            length -= n
+        return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+    
+    def read_into(self, virtual_address, buffer):
+        """
+        Copy bytes starting at a virtual address into a caller-provided buffer.
         
-        # Mark the page as modified
-        entry.modified = True
+        Like read_bytes, but fills an existing buffer so callers can assemble a
+        large read in one preallocated allocation.
         
-        self.ram.write_byte(physical_address, value)
+        Args:
+            virtual_address (int): The virtual address to start reading from.
+            buffer (writable bytes-like): Destination; len(buffer) bytes are read.
+            
+        Raises:
+            MemoryError: If any page in the range is not present in physical memory.
+            IndexError: If the range is outside the virtual address space.
+        """
+        buffer = memoryview(buffer).cast('B')
+        length = len(buffer)
+        if length == 0:
+            return
+        self.get_page_number(virtual_address + length - 1)
+        
+        pos = 0
+        while pos < length:
+            offset = self.get_offset(virtual_address)
+            n = min(length - pos, self.page_size - offset)
+            physical_address = self.translate_address(virtual_address)
+            self.ram.read_into(physical_address, buffer[pos:pos + n])
+            virtual_address += n
+            pos += n
+    
+    def write_bytes(self, virtual_address, data):
+        """
+        Write a run of bytes starting at a virtual address.
+        
+        The address is translated once per page touched and each page's share of
+        the data is copied with a single slice assignment.
+        
+        Args:
+            virtual_address (int): The virtual address to start writing to.
+            data (bytes-like): The bytes to write.
+            
+        Raises:
+            MemoryError: If any page in the range is not present in physical memory.
+            ValueError: If any page in the range is read-only.
+            IndexError: If the range is outside the virtual address space.
+        """
+        data = memoryview(data).cast('B')
+        length = len(data)
+        if length == 0:
+            return
+        self.get_page_number(virtual_address + length - 1)
+        
+        pos = 0
+        while pos < length:
+            offset = self.get_offset(virtual_address)
+            n = min(length - pos, self.page_size - offset)
+            physical_address = self._translate_for_write(virtual_address)
+            self.ram.write_bytes(physical_address, data[pos:pos + n])
+            virtual_address += n
+            pos += n
     
     def allocate_page(self, page_number, read_only=False):
         """
@@ -194,7 +520,7 @@ class PageTable:
             raise IndexError(f"Page number {page_number} out of bounds")
             
         # Check if page is already allocated
-        if self.table[page_number].present:
+        if self.flags[page_number] & PRESENT:
             return True
             
         # Try to allocate a frame from RAM
@@ -205,16 +531,63 @@ class PageTable:
             return False
             
         # Update the page table entry
-        self.table[page_number] = PageTableEntry(
-            frame_number=frame_number,
-            present=True,
-            referenced=False,
-            modified=False,
-            read_only=read_only
-        )
+        self.map_page(page_number, frame_number, read_only=read_only)
         
         return True
     
+    def map_page(self, page_number, frame_number, read_only=False, referenced=False):
+        """
+        Mark a virtual page as present in an already reserved physical frame.
+        
+        The page's flags and frame number are overwritten in place. Callers are
+        responsible for reserving the frame in RAM.
+        
+        Args:
+            page_number (int): The virtual page number to map.
+            frame_number (int): The physical frame backing the page.
+            read_only (bool): Whether the page should be read-only.
+            referenced (bool): Initial value of the referenced bit.
+        """
+        self._uncount_flags(int(self.flags[page_number]))
+        self.flags[page_number] = (PRESENT | (REFERENCED if referenced else 0)
+                                   | (READ_ONLY if read_only else 0))
+        self.frame_numbers[page_number] = frame_number
+        self.frame_base[page_number] = frame_number << self._page_shift
+        
+        counts = self.flag_counts
+        counts['present'] += 1
+        counts['referenced'] += bool(referenced)
+        counts['read_only'] += bool(read_only)
+        self.version += 1
+        self._present_pages.add(int(page_number))
+    
+    def map_pages(self, page_numbers, frame_numbers, read_only=False):
+        """
+        Map many distinct virtual pages onto already reserved frames at once.
+        
+        Equivalent to calling map_page for each (page, frame) pair, but done with
+        a single array assignment.
+        
+        Args:
+            page_numbers (array-like): The virtual page numbers to map.
+            frame_numbers (array-like): The physical frame backing each page.
+            read_only (bool): Whether the pages should be read-only.
+        """
+        pages = np.asarray(page_numbers, dtype=np.int64)
+        if not pages.size:
+            return
+        
+        self._uncount_flag_array(self.flags[pages])
+        self.flags[pages] = PRESENT | (READ_ONLY if read_only else 0)
+        self.frame_numbers[pages] = frame_numbers
+        self.frame_base[pages] = self.frame_numbers[pages].astype(np.int64) << self._page_shift
+        self._present_pages.update(pages.tolist())
+        
+        self.flag_counts['present'] += int(pages.size)
+        if read_only:
+            self.flag_counts['read_only'] += int(pages.size)
+        self.version += 1
+    
     def deallocate_page(self, page_number):
         """
         Deallocate a virtual page, freeing its physical frame.
@@ -229,16 +602,52 @@ class PageTable:
         if not 0 <= page_number < self.num_pages:
             raise IndexError(f"Page number {page_number} out of bounds")
             
-        entry = self.table[page_number]
+        flags = int(self.flags[page_number])
+        frame_number = int(self.frame_numbers[page_number])
         
-        if not entry.present or entry.frame_number is None:
+        if not flags & PRESENT or frame_number < 0:
             raise ValueError(f"Page {page_number} is not allocated")
             
         # Free the physical frame
-        self.ram.deallocate_frame(entry.frame_number)
+        self.ram.deallocate_frame(frame_number)
         
         # Reset the page table entry
-        self.table[page_number] = PageTableEntry()
+        self._uncount_flags(flags)
+        self.flags[page_number] = 0
+        self.frame_numbers[page_number] = -1
+        self.frame_base[page_number] = -1
+        self.version += 1
+        self._present_pages.discard(page_number)
+    
+    def deallocate_pages(self, page_numbers):
+        """
+        Deallocate many virtual pages at once, skipping any that are not allocated.
+        
+        Pages are filtered against the present bits up front, so callers do not
+        need to guard each page with its own try/except.
+        
+        Args:
+            page_numbers (iterable): The virtual page numbers to deallocate.
+            
+        Returns:
+            int: Number of pages that were actually deallocated.
+        """
+        pages = np.unique(np.fromiter(page_numbers, dtype=np.int64))
+        pages = pages[(pages >= 0) & (pages < self.num_pages)]
+        pages = pages[(self.flags[pages] & PRESENT) != 0]
+        if not pages.size:
+            return 0
+        
+        for frame_number in self.frame_numbers[pages].tolist():
+            self.ram.deallocate_frame(frame_number)
+        
+        self._uncount_flag_array(self.flags[pages])
+        self.flags[pages] = 0
+        self.frame_numbers[pages] = -1
+        self.frame_base[pages] = -1
+        self.version += 1
+        self._present_pages.difference_update(pages.tolist())
+        return int(pages.size)
     
     def get_page_info(self, page_number):
         """
@@ -256,15 +665,16 @@ class PageTable:
         if not 0 <= page_number < self.num_pages:
             raise IndexError(f"Page number {page_number} out of bounds")
             
-        entry = self.table[page_number]
+        flags = int(self.flags[page_number])
+        frame_number = int(self.frame_numbers[page_number])
         
         return {
             'page_number': page_number,
-            'frame_number': entry.frame_number,
-            'present': entry.present,
-            'referenced': entry.referenced,
-            'modified': entry.modified,
-            'read_only': entry.read_only
+            'frame_number': frame_number if frame_number >= 0 else None,
+            'present': bool(flags & PRESENT),
+            'referenced': bool(flags & REFERENCED),
+            'modified': bool(flags & MODIFIED),
+            'read_only': bool(flags & READ_ONLY)
         }
     
     def get_table_statistics(self):
@@ -274,10 +684,10 @@ class PageTable:
         Returns:
             dict: Statistics about the page table.
         """
-        present_pages = sum(1 for entry in self.table if entry.present)
-        modified_pages = sum(1 for entry in self.table if entry.modified)
-        referenced_pages = sum(1 for entry in self.table if entry.referenced)
-        read_only_pages = sum(1 for entry in self.table if entry.read_only)
+        present_pages = self.flag_counts['present']
+        modified_pages = self.flag_counts['modified']
+        referenced_pages = self.flag_counts['referenced']
+        read_only_pages = self.flag_counts['read_only']
         
         return {
             'total_pages': self.num_pages,
@@ -310,9 +720,9 @@ class PageTable:
         }
         
         # Check if page is already present
-        if self.table[page_number].present:
+        if self.flags[page_number] & PRESENT:
             # Mark as referenced
-            self.table[page_number].referenced = True
+            self._set_flag(page_number, REFERENCED, True)
             result['page_fault'] = False
             result['success'] = True
             return result
@@ -323,10 +733,8 @@ class PageTable:
         if frame_number == -1:
             # No free frames - need page replacement
             if paging_algorithm:
-                pages_in_memory = set()
-                for i, entry in enumerate(self.table):
-                    if entry.present:
-                        pages_in_memory.add(i)
+                # Live set, not a copy: algorithms must treat it as read-only
+                pages_in_memory = self._present_pages
                 
                 evicted_page, _ = paging_algorithm.access_page(
                     page_number, pages_in_memory, self.ram.num_frames
@@ -344,12 +752,7 @@ class PageTable:
                 return result  # Still couldn't allocate
         
         # Load the page into memory
-        self.table[page_number] = PageTableEntry(
-            frame_number=frame_number,
-            present=True,
-            referenced=True,
-            modified=False
-        )
+        self.map_page(page_number, frame_number, referenced=True)
         
         result['success'] = True
         return result
@@ -369,30 +772,31 @@ class PageTable:
         if not 0 <= page_number < self.num_pages:
             raise IndexError(f"Page number {page_number} out of bounds")
         
-        entry = self.table[page_number]
+        flags = int(self.flags[page_number])
         
-        if not entry.present:
+        # Reject read-only writes before any bits change
+        if is_write and flags & (PRESENT | READ_ONLY) == PRESENT | READ_ONLY:
+            raise ValueError(f"Attempted to write to read-only page {page_number}")
+        
+        if not flags & PRESENT:
             # Page fault - need to load the page
             fault_result = self.handle_page_fault(page_number, paging_algorithm)
             if not fault_result['success']:
                 return fault_result
-            entry = self.table[page_number]  # Refresh entry
         
         # Mark as referenced
-        entry.referenced = True
+        self._set_flag(page_number, REFERENCED, True)
         
         # Mark as modified if it's a write
         if is_write:
-            if entry.read_only:
-                raise ValueError(f"Attempted to write to read-only page {page_number}")
-            entry.modified = True
+            self._set_flag(page_number, MODIFIED, True)
         
         return {
             'page_number': page_number,
             'page_fault': False,
             'evicted_page': None,
             'success': True,
-            'frame_number': entry.frame_number
+            'frame_number': int(self.frame_numbers[page_number])
         }
     
     def get_pages_in_memory(self):
@@ -402,12 +806,125 @@ class PageTable:
         Returns:
             list: List of page numbers currently in memory
         """
-        return [i for i, entry in enumerate(self.table) if entry.present]
+        return self.allocated_page_indices().tolist()
+    
+    def is_present(self, page_number):
+        """
+        Check whether a page is present without building a page info dict.
+        
+        Args:
+            page_number (int): The virtual page number.
+            
+        Returns:
+            bool: True if the page is mapped to a physical frame.
+        """
+        return bool(self.flags[page_number] & PRESENT)
+    
+    def allocated_page_indices(self):
+        """
+        Get the numbers of all present pages from the packed flags.
+        
+        Returns:
+            numpy.ndarray: Sorted array of present page numbers.
+        """
+        return np.flatnonzero(self.flags & PRESENT)
+    
+    def get_frame_base_array(self):
+        """
+        Get the live per-page frame base addresses for direct indexing.
+        
+        The array is the table's own storage, not a copy. A consumer translating
+        addresses itself must check the page's PRESENT bit (bit 0 of
+        get_flags_array()) first and fall back to handle_page_fault when it is 0.
+        
+        Returns:
+            numpy.ndarray: int64 physical address of each page's frame, -1 if unmapped.
+        """
+        return self.frame_base
+    
+    def get_flags_array(self):
+        """
+        Get the live per-page flag bytes for direct indexing.
+        
+        The array is the table's own storage, not a copy; it should be treated
+        as read-only, since writing to it bypasses flag_counts and version.
+        
+        Returns:
+            numpy.ndarray: uint8 flags per page (PRESENT is bit 0).
+        """
+        return self.flags
+    
+    def find_free_run(self, count):
+        """
+        Find the first run of consecutive non-present pages.
+        
+        Args:
+            count (int): Number of consecutive free pages required.
+            
+        Returns:
+            int: The first page number of the run, or None if no run is long enough.
+        """
+        if count <= 0:
+            return 0
+        if count > self.num_pages:
+            return None
+        
+        # Free pages in every window of `count` pages, via a prefix sum
+        free_prefix = np.concatenate(([0], np.cumsum((self.flags & PRESENT) == 0)))
+        hits = np.flatnonzero(free_prefix[count:] - free_prefix[:-count] == count)
+        return int(hits[0]) if hits.size else None
     
     def clear_reference_bits(self):
         """Clear all reference bits in the page table."""
-        for entry in self.table:
-            entry.referenced = False
+        # Clock-style callers clear every tick; skip the sweep when nothing is set
+        if not self.flag_counts['referenced']:
+            return
+        self.flags &= np.uint8(~REFERENCED & 0xFF)
+        self.flag_counts['referenced'] = 0
+        self.version += 1
+    
+    def snapshot(self, page_numbers=None):
+        """
+        Capture the page table state so it can be put back with restore().
+        
+        Args:
+            page_numbers (array-like, optional): Only capture these pages' flags and
+                frame numbers. By default the whole table is captured.
+            
+        Returns:
+            tuple: The captured pages (None for all), copies of their flags and frame
+            numbers, and the version and flag counts.
+        """
+        if page_numbers is None:
+            return (None, self.flags.copy(), self.frame_numbers.copy(),
+                    self.version, dict(self.flag_counts))
+        pages = np.array(page_numbers, dtype=np.int64)
+        return (pages, self.flags[pages], self.frame_numbers[pages],
+                self.version, dict(self.flag_counts))
+    
+    def restore(self, snapshot):
+        """
+        Put back state captured by snapshot(), in place.
+        
+        Args:
+            snapshot (tuple): A value returned by snapshot().
+        """
+        pages, flags, frame_numbers, version, flag_counts = snapshot
+        if pages is None:
+            np.copyto(self.flags, flags)
+            np.copyto(self.frame_numbers, frame_numbers)
+            self._refresh_frame_base(slice(None))
+            self._present_pages = set(self.allocated_page_indices().tolist())
+        else:
+            self.flags[pages] = flags
+            self.frame_numbers[pages] = frame_numbers
+            self._refresh_frame_base(pages)
+            present = (flags & PRESENT) != 0
+            self._present_pages.difference_update(pages[~present].tolist())
+            self._present_pages.update(pages[present].tolist())
+        self.version = version
+        self.flag_counts = dict(flag_counts)
+        self._tlb = (-1, -1, 0)
     
     def get_memory_layout(self):
         """
@@ -416,8 +933,22 @@ class PageTable:
         Returns:
             dict: Mapping of frame numbers to page numbers
         """
-        layout = {}
-        for page_num, entry in enumerate(self.table):
-            if entry.present and entry.frame_number is not None:
-                layout[entry.frame_number] = page_num
-        return layout
\ No newline at end of file
+        pages = np.flatnonzero((self.flags & PRESENT) & (self.frame_numbers >= 0))
+        return dict(zip(self.frame_numbers[pages].tolist(), pages.tolist()))
+    
+    def get_memory_overview(self):
+        """
+        Get the pages in memory, the memory layout and the table statistics together.
+        
+        Equivalent to calling get_pages_in_memory, get_memory_layout and
+        get_table_statistics back to back, but the flags are scanned only once.
+        
+        Returns:
+            tuple: (pages_in_memory, memory_layout, statistics) as returned by
+            those three methods.
+        """
+        pages = self.allocated_page_indices()
+        frame_numbers = self.frame_numbers[pages]
+        mapped = frame_numbers >= 0
+        layout = dict(zip(frame_numbers[mapped].tolist(), pages[mapped].tolist()))
+        return pages.tolist(), layout, self.get_table_statistics()
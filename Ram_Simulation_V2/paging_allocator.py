@@ -1,3 +1,13 @@
+import numpy as np
+
+from page_table import PRESENT
+
+
+# Largest fraction of pages in use (after allocating) at which free pages are
+# found by random sampling instead of scanning the page table
+SAMPLING_MAX_USAGE = 0.1
+
+
 class PagingAllocator:
     """
     Implements non-contiguous memory allocation using paging.
@@ -31,8 +41,6 @@ class PagingAllocator:
                 starting_page (int): The first virtual page allocated
                 pages_allocated (list): List of allocated page numbers
         """
-        import random
-        
         # Calculate number of pages needed
         pages_needed = (size_bytes + self.page_table.page_size - 1) // self.page_table.page_size
         
@@ -40,18 +48,21 @@ class PagingAllocator:
         if self.ram.get_free_frames_count() < pages_needed:
             return False, None, []
         
+        # With almost every page free, random guesses find free pages without a full scan
+        present_pages = self.page_table.flag_counts['present']
+        if present_pages + pages_needed <= self.page_table.num_pages * SAMPLING_MAX_USAGE:
+            selected_pages = self._sample_free_pages(pages_needed)
+            if selected_pages is not None:
+                return self._allocate_pages(np.sort(selected_pages).tolist())
+        
         # Find all free pages
-        free_pages = []
-        for i in range(self.page_table.num_pages):
-            if not self.page_table.table[i].present:
-                free_pages.append(i)
+        free_pages = np.flatnonzero((self.page_table.flags & PRESENT) == 0)
         
         if len(free_pages) < pages_needed:
             return False, None, []
         
         # For truly non-contiguous allocation, select random free pages
         # Instead of sequential pages
-        allocated_pages = []
         
         # Choose pages with some gaps between them to demonstrate non-contiguity
         # Sample a subset of free pages with some spacing
@@ -59,25 +70,33 @@ class PagingAllocator:
             # If we have plenty of free pages, select them with gaps
             candidate_pages = free_pages[::2]  # Take every other free page
             if len(candidate_pages) >= pages_needed:
-                selected_pages = random.sample(candidate_pages, pages_needed)
-                allocated_pages = sorted(selected_pages)  # Sort for easier tracking
+                selected_pages = np.random.choice(candidate_pages, pages_needed, replace=False)
             else:
                 # Fall back to random selection if we don't have enough with gaps
-                allocated_pages = sorted(random.sample(free_pages, pages_needed))
+                selected_pages = np.random.choice(free_pages, pages_needed, replace=False)
         else:
             # If we don't have many free pages, just randomly select from what's available
-            allocated_pages = sorted(random.sample(free_pages, pages_needed))
-        
-        # Allocate the selected pages
-        for page_num in allocated_pages:
-            success = self.page_table.allocate_page(page_num)
-            if not success:
-                # Rollback allocations on failure
-                for p in allocated_pages:
-                    if p != page_num:  # Skip the one that failed
-                        self.page_table.deallocate_page(p)
-                return False, None, []
+            selected_pages = np.random.choice(free_pages, pages_needed, replace=False)
+        allocated_pages = np.sort(selected_pages).tolist()  # Sort for easier tracking
+        return self._allocate_pages(allocated_pages)
+    
+    def _sample_free_pages(self, pages_needed):
+        """Pick distinct free pages by rejection sampling, or None if too few were hit."""
+        flags = self.page_table.flags
+        candidates = np.random.randint(0, len(flags), pages_needed * 2)
+        candidates = candidates[(flags[candidates] & PRESENT) == 0]
+        _, first_seen = np.unique(candidates, return_index=True)
+        if len(first_seen) < pages_needed:
+            return None
+        return candidates[np.sort(first_seen)[:pages_needed]]
+    
+    def _allocate_pages(self, allocated_pages):
+        """Back the chosen free pages with frames reserved in one batch."""
+        frame_numbers = self.ram.allocate_frames(len(allocated_pages))
+        if frame_numbers is None:
+            return False, None, []
         
+        self.page_table.map_pages(allocated_pages, frame_numbers)
         return True, allocated_pages[0], allocated_pages
     
     def deallocate(self, page_numbers):
@@ -90,11 +109,7 @@ class PagingAllocator:
         Returns:
             bool: Whether deallocation succeeded
         """
-        for page_num in page_numbers:
-            try:
-                self.page_table.deallocate_page(page_num)
-            except Exception:
-                # Continue even if one page fails to deallocate
-                pass
+        # Pages that are already free are skipped
+        self.page_table.deallocate_pages(page_numbers)
         
         return True
\ No newline at end of file
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 class RAM:
     """
     A class that simulates Random Access Memory (RAM) for the file system simulator.
@@ -10,8 +13,12 @@ class RAM:
         size (int): Total size of RAM in bytes.
         frame_size (int): Size of each memory frame in bytes.
         num_frames (int): Number of frames in RAM.
-        memory (list): The memory array storing byte values.
-        frame_table (list): Tracks allocation status of each frame (True if allocated).
+        memory (bytearray): The memory buffer storing byte values.
+        frame_table (numpy.ndarray): Boolean array tracking allocation status of each frame (True if allocated).
+        frame_version (int): Counter bumped whenever frame_table changes, so callers
+            can cache views of the free frames.
+        next_free_hint (int): Every frame below this index is allocated, so free
+            frame searches can start here.
     """
     
     def __init__(self, size=1024*1024, frame_size=4096):
@@ -27,10 +34,12 @@ class RAM:
         self.num_frames = size // frame_size
         
         # Initialize memory with zeros
-        self.memory = [0] * size
+        self.memory = bytearray(size)
         
         # Initialize frame allocation table (False = free, True = allocated)
-        self.frame_table = [False] * self.num_frames
+        self.frame_table = np.zeros(self.num_frames, dtype=np.bool_)
+        self.frame_version = 0
+        self.next_free_hint = 0
         
     def read_byte(self, address):
         """
@@ -70,6 +79,59 @@ class RAM:
             
         self.memory[address] = value
     
+    def read_bytes(self, address, length):
+        """
+        Read a contiguous run of bytes starting at a memory address.
+        
+        Args:
+            address (int): The memory address to start reading from.
+            length (int): Number of bytes to read.
+            
+        Returns:
+            bytes: The bytes stored in the requested range.
+            
+        Raises:
+            IndexError: If the range falls outside memory bounds.
+        """
+        if not (0 <= address and length >= 0 and address + length <= self.size):
+            raise IndexError(f"Memory range {address}..{address + length} out of bounds")
+        # Slicing through a memoryview copies once, straight into the bytes object
+        with memoryview(self.memory) as view:
+            return bytes(view[address:address + length])
+    
+    def read_into(self, address, buffer):
+        """
+        Copy bytes starting at a memory address into a caller-provided buffer.
+        
+        Args:
+            address (int): The memory address to start reading from.
+            buffer (writable bytes-like): Destination; len(buffer) bytes are copied.
+            
+        Raises:
+            IndexError: If the range falls outside memory bounds.
+        """
+        length = len(buffer)
+        if not (0 <= address and address + length <= self.size):
+            raise IndexError(f"Memory range {address}..{address + length} out of bounds")
+        with memoryview(self.memory) as view:
+            buffer[:] = view[address:address + length]
+    
+    def write_bytes(self, address, data):
+        """
+        Write a contiguous run of bytes starting at a memory address.
+        
+        Args:
+            address (int): The memory address to start writing to.
+            data (bytes-like): The bytes to write.
+            
+        Raises:
+            IndexError: If the range falls outside memory bounds.
+        """
+        length = len(data)
+        if not (0 <= address and address + length <= self.size):
+            raise IndexError(f"Memory range {address}..{address + length} out of bounds")
+        self.memory[address:address + length] = data
+    
     def read_frame(self, frame_number):
         """
         Read the contents of an entire frame.
@@ -78,7 +140,7 @@ class RAM:
             frame_number (int): The frame number to read.
             
         Returns:
-            list: A list containing the bytes in the specified frame.
+            bytearray: A copy of the bytes in the specified frame.
             
         Raises:
             IndexError: If the frame number is invalid.
@@ -96,7 +158,7 @@ class RAM:
         
         Args:
             frame_number (int): The frame number to write to.
-            data (list): The byte data to write to the frame.
+            data (bytes-like or list): The byte data to write to the frame.
             
         Raises:
             IndexError: If the frame number is invalid.
@@ -109,10 +171,15 @@ class RAM:
             raise ValueError(f"Data size {len(data)} doesn't match frame size {self.frame_size}")
             
         start_address = frame_number * self.frame_size
-        for i, value in enumerate(data):
-            if not 0 <= value <= 255:
-                raise ValueError(f"Value {value} at position {i} is not a valid byte (0-255)")
-            self.memory[start_address + i] = value
+        try:
+            data = bytes(data)
+        except ValueError:
+            # Only walk the values to report the first bad one
+            for i, value in enumerate(data):
+                if not 0 <= value <= 255:
+                    raise ValueError(f"Value {value} at position {i} is not a valid byte (0-255)") from None
+            raise
+        self.memory[start_address:start_address + self.frame_size] = data
     
     def allocate_frame(self):
         """
@@ -121,11 +188,40 @@ class RAM:
         Returns:
             int: The frame number that was allocated, or -1 if no frames are available.
         """
-        for i in range(self.num_frames):
-            if not self.frame_table[i]:
-                self.frame_table[i] = True
-                return i
-        return -1  # No free frames
+        hint = self.next_free_hint
+        free = np.flatnonzero(~self.frame_table[hint:])
+        if free.size == 0:
+            self.next_free_hint = self.num_frames
+            return -1  # No free frames
+        frame_number = hint + int(free[0])
+        self.frame_table[frame_number] = True
+        self.frame_version += 1
+        self.next_free_hint = frame_number + 1
+        return frame_number
+    
+    def allocate_frames(self, count):
+        """
+        Allocate several available frames at once, lowest numbered first.
+        
+        Either all requested frames are allocated or none are.
+        
+        Args:
+            count (int): Number of frames to allocate.
+            
+        Returns:
+            numpy.ndarray: The allocated frame numbers in ascending order, or None if
+            fewer than count frames are free.
+        """
+        hint = self.next_free_hint
+        free = np.flatnonzero(~self.frame_table[hint:])
+        if free.size < count:
+            return None
+        frame_numbers = free[:count] + hint
+        self.frame_table[frame_numbers] = True
+        self.frame_version += 1
+        if count:
+            self.next_free_hint = int(frame_numbers[-1]) + 1
+        return frame_numbers
     
     def deallocate_frame(self, frame_number):
         """
@@ -145,11 +241,12 @@ class RAM:
             raise ValueError(f"Frame {frame_number} is already free")
             
         self.frame_table[frame_number] = False
+        self.frame_version += 1
+        self.next_free_hint = min(self.next_free_hint, frame_number)
         
         # Optionally clear the frame data
         start_address = frame_number * self.frame_size
-        for i in range(self.frame_size):
-            self.memory[start_address + i] = 0
+        self.memory[start_address:start_address + self.frame_size] = bytes(self.frame_size)
     
     def get_free_frames_count(self):
         """
@@ -158,7 +255,7 @@ class RAM:
         Returns:
             int: Number of free frames.
         """
-        return self.frame_table.count(False)
+        return self.num_frames - int(np.count_nonzero(self.frame_table))
     
     def get_memory_usage(self):
         """
@@ -167,7 +264,7 @@ class RAM:
         Returns:
             dict: A dictionary containing memory usage statistics.
         """
-        used_frames = self.frame_table.count(True)
+        used_frames = int(np.count_nonzero(self.frame_table))
         return {
             'total_size': self.size,
             'frame_size': self.frame_size,
@@ -1,5 +1,6 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
 import io
 import os
@@ -24,6 +25,16 @@ if 'page_table' not in st.session_state:
 if 'file_info' not in st.session_state:
     st.session_state.file_info = None
 
+
+def _memoize_in_session(key, version, build):
+    """Return session-cached value for key, rebuilding when version changes."""
+    cached = st.session_state.get(key)
+    if cached is None or cached[0] != version:
+        cached = (version, build())
+        st.session_state[key] = cached
+    return cached[1]
+
+
 def setup_environment():
     """Set up RAM and page table with user-defined parameters."""
     st.header("Memory System Setup")
@@ -51,6 +62,10 @@ def setup_environment():
         st.session_state.ram = ram
         st.session_state.page_table = page_table
         st.session_state.file_info = None
+        st.session_state.pop('_memory_usage_cache', None)
+        st.session_state.pop('_table_stats_cache', None)
+        st.session_state.pop('_allocated_pages_cache', None)
+        st.session_state.pop('_storage_figure_cache', None)
         
         st.success("Memory system created successfully!")
         
@@ -60,6 +75,7 @@ def setup_environment():
         with col2:
             st.info(f"Virtual Memory: {address_space_size/1024/1024:.1f} MB address space, {page_size/1024:.1f} KB pages, {page_table.num_pages} pages")
 
+@st.fragment
 def store_file():
     """Store a file in memory using the page table."""
     st.header("Store File in Memory")
@@ -90,17 +106,7 @@ def store_file():
             file_data = uploaded_file.getvalue()
             
             # Find consecutive free pages
-            starting_page = None
-            for i in range(page_table.num_pages - pages_needed + 1):
-                consecutive_free = True
-                for j in range(pages_needed):
-                    if page_table.table[i + j].present:
-                        consecutive_free = False
-                        break
-                
-                if consecutive_free:
-                    starting_page = i
-                    break
+            starting_page = page_table.find_free_run(pages_needed)
             
             if starting_page is None:
                 st.error("Could not find consecutive free pages for file storage.")
@@ -110,12 +116,15 @@ def store_file():
             status_text = st.empty()
             
             try:
-                # Store file data page by page
+                # Store file data page by page, only redrawing progress when it moves
+                last_progress = -1
                 for i in range(pages_needed):
                     page_num = starting_page + i
-                    progress = int((i / pages_needed) * 100)
-                    progress_bar.progress(progress)
-                    status_text.text(f"Storing data in page {page_num}...")
+                    progress = (i * 100) // pages_needed
+                    if progress != last_progress:
+                        progress_bar.progress(progress)
+                        status_text.text(f"Storing data in page {page_num}...")
+                        last_progress = progress
                     
                     # Allocate the page
                     success = page_table.allocate_page(page_num, read_only=False)
@@ -131,10 +140,7 @@ def store_file():
                     end_offset = min((i + 1) * page_table.page_size, file_size)
                     data_chunk = file_data[start_offset:end_offset]
                     
-                    # Write data chunk byte by byte
-                    for j, byte_value in enumerate(data_chunk):
-                        virtual_addr = (page_num * page_table.page_size) + j
-                        page_table.write_byte(virtual_addr, byte_value)
+                    page_table.write_page_bytes(page_num, data_chunk)
                 
                 progress_bar.progress(100)
                 status_text.text("File stored successfully!")
@@ -157,6 +163,7 @@ def store_file():
             except Exception as e:
                 st.error(f"Error storing file: {e}")
 
+@st.fragment
 def retrieve_file():
     """Retrieve a file from memory using the page table."""
     st.header("Retrieve File from Memory")
@@ -200,35 +207,34 @@ def retrieve_file():
                     st.error(f"Error checking page {page_num}: {e}")
                     return
             
-            # Retrieve file data
-            file_data = bytearray()
+            # Retrieve file data into a buffer sized for the whole file
+            file_data = bytearray(file_size)
             
             progress_bar = st.progress(0)
             status_text = st.empty()
             
             bytes_read = 0
             
+            # Only redraw progress when it moves
+            last_progress = -1
             for i in range(pages_count):
                 page_num = starting_page + i
-                base_addr = page_num * page_table.page_size
                 
-                progress = int((i / pages_count) * 100)
-                progress_bar.progress(progress)
-                status_text.text(f"Reading page {page_num}...")
+                progress = (i * 100) // pages_count
+                if progress != last_progress:
+                    progress_bar.progress(progress)
+                    status_text.text(f"Reading page {page_num}...")
+                    last_progress = progress
                 
-                # Read page data
-                for j in range(page_table.page_size):
-                    # Stop if we've read the entire file
-                    if bytes_read >= file_size:
-                        break
-                    
-                    try:
-                        byte_value = page_table.read_byte(base_addr + j)
-                        file_data.append(byte_value)
-                        bytes_read += 1
-                    except Exception as e:
-                        st.warning(f"Error reading byte at address {base_addr + j}: {str(e)}")
-                        break  # Stop on error
+                # Read page data, stopping once the entire file has been read
+                length = min(page_table.page_size, file_size - bytes_read)
+                try:
+                    file_data[bytes_read:bytes_read + length] = page_table.read_page_bytes(page_num, length)
+                    bytes_read += length
+                except Exception as e:
+                    st.warning(f"Error reading page {page_num}: {str(e)}")
+                    break  # Stop on error
+            del file_data[bytes_read:]
             
             progress_bar.progress(100)
             status_text.text("File retrieved successfully!")
@@ -251,6 +257,7 @@ def retrieve_file():
         except Exception as e:
             st.error(f"Error retrieving file: {e}")
 
+@st.fragment
 def view_memory_usage():
     """Display memory usage statistics and visualizations."""
     st.header("Memory Usage")
@@ -267,7 +274,7 @@ def view_memory_usage():
     with col1:
         st.subheader("RAM Usage")
         try:
-            ram_usage = ram.get_memory_usage()
+            ram_usage = _memoize_in_session('_memory_usage_cache', ram.frame_version, ram.get_memory_usage)
             
             # Create a DataFrame for better display
             ram_data = []
@@ -287,7 +294,9 @@ def view_memory_usage():
     with col2:
         st.subheader("Page Table Statistics")
         try:
-            page_stats = page_table.get_table_statistics()
+            page_stats = _memoize_in_session(
+                '_table_stats_cache', page_table.version, page_table.get_table_statistics
+            )
             
             # Create a DataFrame for better display
             page_data = []
@@ -304,6 +313,7 @@ def view_memory_usage():
         except Exception as e:
             st.error(f"Error displaying page table statistics: {e}")
 
+@st.fragment
 def view_page_table():
     """Display the contents of the page table."""
     st.header("Page Table Viewer")
@@ -336,42 +346,38 @@ def view_page_table():
     elif view_option == "View summary statistics":
         display_table_statistics(page_table)
 
+def _page_table_frame(page_table, page_nums):
+    """Build a page table DataFrame for the given pages, one column at a time."""
+    page_nums = np.asarray(page_nums, dtype=np.int64)
+    frames = page_table.frame_numbers[page_nums]
+    return pd.DataFrame({
+        "Page #": page_nums,
+        "Frame #": np.where(frames >= 0, frames.astype(str), "N/A"),
+    })
+
 def display_page_table_range(page_table, start, end):
     """Display a range of page table entries."""
-    data = []
-    
-    for page_num in range(start, end + 1):
-        try:
-            entry = page_table.table[page_num]
-            frame = str(entry.frame_number) if entry.frame_number is not None else "N/A"
-            
-           
-            
-            data.append({
-                "Page #": page_num,
-                "Frame #": frame,
-                
-            })
-        except Exception as e:
-            st.error(f"Error accessing page {page_num}: {e}")
+    try:
+        df = _page_table_frame(page_table, np.arange(start, end + 1))
+    except Exception as e:
+        st.error(f"Error accessing pages {start}-{end}: {e}")
+        return
     
-    if not data:
+    if df.empty:
         st.warning("No page data to display.")
         return
         
-    df = pd.DataFrame(data)
     st.dataframe(df, use_container_width=True)
     
       
 
 def display_allocated_pages(page_table):
     """Display only allocated pages in the page table."""
-    allocated_pages = []
-    
     try:
-        for page_num in range(page_table.num_pages):
-            if page_table.table[page_num].present:
-                allocated_pages.append(page_num)
+        allocated_pages = _memoize_in_session(
+            '_allocated_pages_cache', page_table.version,
+            lambda: page_table.allocated_page_indices().tolist()
+        )
     except Exception as e:
         st.error(f"Error scanning allocated pages: {e}")
         return
@@ -380,23 +386,8 @@ def display_allocated_pages(page_table):
         st.info("No pages are currently allocated.")
         return
     
-    data = []
-    for page_num in allocated_pages:
-        try:
-            entry = page_table.table[page_num]
-            frame = str(entry.frame_number) if entry.frame_number is not None else "N/A"
-           
-            
-            data.append({
-                "Page #": page_num,
-                "Frame #": frame,
-                
-            })
-        except Exception as e:
-            st.warning(f"Error accessing page {page_num}: {e}")
-    
     st.write(f"Allocated Pages ({len(allocated_pages)} total):")
-    df = pd.DataFrame(data)
+    df = _page_table_frame(page_table, allocated_pages)
     st.dataframe(df, use_container_width=True)
     
    
@@ -404,7 +395,9 @@ def display_allocated_pages(page_table):
 def display_table_statistics(page_table):
     """Display summary statistics about the page table."""
     try:
-        stats = page_table.get_table_statistics()
+        stats = _memoize_in_session(
+            '_table_stats_cache', page_table.version, page_table.get_table_statistics
+        )
         
         data = []
         for key, value in stats.items():
@@ -423,9 +416,20 @@ def display_table_statistics(page_table):
 def visualize_file_storage(starting_page, pages_count, page_table):
     """Visualize how a file is stored across pages."""
     try:
-        # Create a visualization showing which pages are used by the file
-        fig, ax = plt.subplots(figsize=(10, 3))
-        
+        # Only redraw when the file range or the page table has changed
+        png = _memoize_in_session(
+            '_storage_figure_cache', (starting_page, pages_count, page_table.version),
+            lambda: _render_storage_figure(starting_page, pages_count, page_table)
+        )
+        st.image(png)
+    except Exception as e:
+        st.error(f"Error visualizing file storage: {e}")
+
+def _render_storage_figure(starting_page, pages_count, page_table):
+    """Draw the file storage figure and return it as PNG bytes."""
+    # Create a visualization showing which pages are used by the file
+    fig, ax = plt.subplots(figsize=(10, 3))
+    try:
         # Get status of all pages in range
         all_pages = range(min(page_table.num_pages, 500))  # Limit to 500 pages for visualization
         page_status = []
@@ -465,9 +469,11 @@ def visualize_file_storage(starting_page, pages_count, page_table):
         cbar.set_ticks([0, 0.5, 1])
         cbar.set_ticklabels(['Unallocated', 'Other Allocated', 'File Pages'])
         
-        st.pyplot(fig)
-    except Exception as e:
-        st.error(f"Error visualizing file storage: {e}")
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png')
+        return buffer.getvalue()
+    finally:
+        plt.close(fig)
 
 def main():
     st.title("File System Memory Simulator")
@@ -483,7 +489,8 @@ def main():
         ["Setup Memory System", "Store File", "Retrieve File", "View Memory Usage", "View Page Table"]
     )
     
-    # Display the selected page
+    # Display the selected page; all but setup are fragments, so their widgets
+    # rerun only that view (setup also changes the sidebar, so it reruns everything)
     if page == "Setup Memory System":
         setup_environment()
     elif page == "Store File":
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 class PageTableEntry:
     """
     Represents a single entry in a page table, mapping a virtual page to a physical frame.
@@ -56,6 +59,12 @@ class PageTable:
         address_space_size (int): Size of the virtual address space in bytes.
         num_pages (int): Total number of pages in the virtual address space.
         table (list): List of PageTableEntry objects representing the page table.
+        present (numpy.ndarray): uint8 bitmap of each page's present bit, kept in
+            step with table.
+        frame_numbers (numpy.ndarray): int32 frame number of each page, -1 if unmapped,
+            kept in step with table.
+        version (int): Counter bumped whenever a page is allocated or deallocated or
+            one of its referenced/modified bits is set.
         ram (RAM): Reference to the RAM object used for physical memory operations.
     """
     
@@ -75,6 +84,9 @@ class PageTable:
         
         # Initialize empty page table
         self.table = [PageTableEntry() for _ in range(self.num_pages)]
+        self.present = np.zeros(self.num_pages, dtype=np.uint8)
+        self.frame_numbers = np.full(self.num_pages, -1, dtype=np.int32)
+        self.version = 0
     
     def get_page_number(self, virtual_address):
         """
@@ -129,7 +141,9 @@ class PageTable:
             raise MemoryError(f"Page {page_number} is not present in physical memory")
         
         # Mark the page as referenced
-        entry.referenced = True
+        if not entry.referenced:
+            entry.referenced = True
+            self.version += 1
         
         # Calculate the physical address
         physical_address = (entry.frame_number * self.page_size) + offset
@@ -172,10 +186,68 @@ class PageTable:
         physical_address = self.translate_address(virtual_address)
         
         # Mark the page as modified
-        entry.modified = True
+        if not entry.modified:
+            entry.modified = True
+            self.version += 1
         
         self.ram.write_byte(physical_address, value)
     
+    def read_page_bytes(self, page_number, length):
+        """
+        Read the first bytes of a page in one copy.
+        
+        Args:
+            page_number (int): The virtual page number to read from.
+            length (int): Number of bytes to read, at most page_size.
+            
+        Returns:
+            bytes: The bytes stored at the start of the page.
+            
+        Raises:
+            MemoryError: If the page is not present in physical memory.
+            IndexError: If the page number is invalid.
+            ValueError: If length is larger than a page.
+        """
+        if length > self.page_size:
+            raise ValueError(f"Cannot read {length} bytes from a {self.page_size} byte page")
+        if length <= 0:
+            return b""
+        physical_address = self.translate_address(page_number * self.page_size)
+        return self.ram.read_bytes(physical_address, length)
+    
+    def write_page_bytes(self, page_number, data):
+        """
+        Write data to the start of a page in one copy.
+        
+        Args:
+            page_number (int): The virtual page number to write to.
+            data (bytes-like): The bytes to write, at most page_size of them.
+            
+        Raises:
+            MemoryError: If the page is not present in physical memory.
+            IndexError: If the page number is invalid.
+            ValueError: If the page is read-only or data is larger than a page.
+        """
+        if len(data) > self.page_size:
+            raise ValueError(f"Cannot write {len(data)} bytes to a {self.page_size} byte page")
+        if not 0 <= page_number < self.num_pages:
+            raise IndexError(f"Page number {page_number} out of bounds")
+        if not data:
+            return
+        entry = self.table[page_number]
+        
+        if entry.read_only:
+            raise ValueError(f"Cannot write to read-only page {page_number}")
+            
+        physical_address = self.translate_address(page_number * self.page_size)
+        
+        # Mark the page as modified
+        if not entry.modified:
+            entry.modified = True
+            self.version += 1
+        
+        self.ram.write_bytes(physical_address, data)
+    
     def allocate_page(self, page_number, read_only=False):
         """
         Allocate a physical frame for a virtual page.
@@ -212,6 +284,9 @@ class PageTable:
             modified=False,
             read_only=read_only
         )
+        self.present[page_number] = 1
+        self.frame_numbers[page_number] = frame_number
+        self.version += 1
         
         return True
     
@@ -239,6 +314,9 @@ class PageTable:
         
         # Reset the page table entry
         self.table[page_number] = PageTableEntry()
+        self.present[page_number] = 0
+        self.frame_numbers[page_number] = -1
+        self.version += 1
     
     def get_page_info(self, page_number):
         """
@@ -267,6 +345,35 @@ class PageTable:
             'read_only': entry.read_only
         }
     
+    def allocated_page_indices(self):
+        """
+        Get the numbers of all present pages from the present bitmap.
+        
+        Returns:
+            numpy.ndarray: Sorted array of present page numbers.
+        """
+        return np.flatnonzero(self.present)
+    
+    def find_free_run(self, count):
+        """
+        Find the first run of consecutive non-present pages.
+        
+        Args:
+            count (int): Number of consecutive free pages required.
+            
+        Returns:
+            int: The first page number of the run, or None if no run is long enough.
+        """
+        if count <= 0:
+            return 0
+        if count > self.num_pages:
+            return None
+        
+        # Present pages in every window of `count` pages, via a prefix sum
+        present_prefix = np.concatenate(([0], np.cumsum(self.present, dtype=np.int64)))
+        hits = np.flatnonzero(present_prefix[count:] - present_prefix[:-count] == 0)
+        return int(hits[0]) if hits.size else None
+    
     def get_table_statistics(self):
         """
         Get statistics about the page table.
@@ -274,7 +381,7 @@ class PageTable:
         Returns:
             dict: Statistics about the page table.
         """
-        present_pages = sum(1 for entry in self.table if entry.present)
+        present_pages = int(np.count_nonzero(self.present))
         modified_pages = sum(1 for entry in self.table if entry.modified)
         referenced_pages = sum(1 for entry in self.table if entry.referenced)
         read_only_pages = sum(1 for entry in self.table if entry.read_only)
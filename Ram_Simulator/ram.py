@@ -1,3 +1,6 @@
+import heapq
+
+
 class RAM:
     """
     A class that simulates Random Access Memory (RAM) for the file system simulator.
@@ -10,8 +13,10 @@ class RAM:
         size (int): Total size of RAM in bytes.
         frame_size (int): Size of each memory frame in bytes.
         num_frames (int): Number of frames in RAM.
-        memory (list): The memory array storing byte values.
-        frame_table (list): Tracks allocation status of each frame (True if allocated).
+        memory (bytearray): The memory buffer storing byte values.
+        frame_table (bytearray): Tracks allocation status of each frame (1 if allocated).
+        frame_version (int): Counter bumped whenever frame_table changes, so callers
+            can cache usage figures.
     """
     
     def __init__(self, size=1024*1024, frame_size=4096):
@@ -27,10 +32,18 @@ class RAM:
         self.num_frames = size // frame_size
         
         # Initialize memory with zeros
-        self.memory = [0] * size
+        self.memory = bytearray(size)
         
-        # Initialize frame allocation table (False = free, True = allocated)
-        self.frame_table = [False] * self.num_frames
+        # Initialize frame allocation table (0 = free, 1 = allocated)
+        self.frame_table = bytearray(self.num_frames)
+        
+        # Min-heap of free frame numbers, so the lowest free frame is handed out first
+        self._free_frames = list(range(self.num_frames))
+        self._used_count = 0
+        self.frame_version = 0
+        
+        # Freed frames whose old contents have not been zeroed yet (1 = stale)
+        self._stale_frames = bytearray(self.num_frames)
         
     def read_byte(self, address):
         """
@@ -70,6 +83,40 @@ class RAM:
             
         self.memory[address] = value
     
+    def read_bytes(self, address, length):
+        """
+        Read a contiguous run of bytes starting at a memory address.
+        
+        Args:
+            address (int): The memory address to start reading from.
+            length (int): Number of bytes to read.
+            
+        Returns:
+            bytes: The bytes stored in the requested range.
+            
+        Raises:
+            IndexError: If the range falls outside memory bounds.
+        """
+        if not (0 <= address and length >= 0 and address + length <= self.size):
+            raise IndexError(f"Memory range {address}..{address + length} out of bounds")
+        return bytes(self.memory[address:address + length])
+    
+    def write_bytes(self, address, data):
+        """
+        Write a contiguous run of bytes starting at a memory address.
+        
+        Args:
+            address (int): The memory address to start writing to.
+            data (bytes-like): The bytes to write.
+            
+        Raises:
+            IndexError: If the range falls outside memory bounds.
+        """
+        length = len(data)
+        if not (0 <= address and address + length <= self.size):
+            raise IndexError(f"Memory range {address}..{address + length} out of bounds")
+        self.memory[address:address + length] = data
+    
     def read_frame(self, frame_number):
         """
         Read the contents of an entire frame.
@@ -78,7 +125,7 @@ class RAM:
             frame_number (int): The frame number to read.
             
         Returns:
-            list: A list containing the bytes in the specified frame.
+            bytearray: A copy of the bytes in the specified frame.
             
         Raises:
             IndexError: If the frame number is invalid.
@@ -96,7 +143,7 @@ class RAM:
         
         Args:
             frame_number (int): The frame number to write to.
-            data (list): The byte data to write to the frame.
+            data (bytes-like or list): The byte data to write to the frame.
             
         Raises:
             IndexError: If the frame number is invalid.
@@ -109,10 +156,15 @@ class RAM:
             raise ValueError(f"Data size {len(data)} doesn't match frame size {self.frame_size}")
             
         start_address = frame_number * self.frame_size
-        for i, value in enumerate(data):
-            if not 0 <= value <= 255:
-                raise ValueError(f"Value {value} at position {i} is not a valid byte (0-255)")
-            self.memory[start_address + i] = value
+        try:
+            data = bytes(data)
+        except ValueError:
+            # Only walk the values to report the first bad one
+            for i, value in enumerate(data):
+                if not 0 <= value <= 255:
+                    raise ValueError(f"Value {value} at position {i} is not a valid byte (0-255)") from None
+            raise
+        self.memory[start_address:start_address + self.frame_size] = data
     
     def allocate_frame(self):
         """
@@ -121,18 +173,32 @@ class RAM:
         Returns:
             int: The frame number that was allocated, or -1 if no frames are available.
         """
-        for i in range(self.num_frames):
-            if not self.frame_table[i]:
-                self.frame_table[i] = True
-                return i
-        return -1  # No free frames
+        if not self._free_frames:
+            return -1  # No free frames
+        frame_number = heapq.heappop(self._free_frames)
+        if self._stale_frames[frame_number]:
+            self._clear_frame(frame_number)
+        self.frame_table[frame_number] = 1
+        self._used_count += 1
+        self.frame_version += 1
+        return frame_number
     
-    def deallocate_frame(self, frame_number):
+    def _clear_frame(self, frame_number):
+        """Zero a frame's bytes and mark it as no longer stale."""
+        start_address = frame_number * self.frame_size
+        self.memory[start_address:start_address + self.frame_size] = bytes(self.frame_size)
+        self._stale_frames[frame_number] = 0
+    
+    def deallocate_frame(self, frame_number, clear=False):
         """
         Deallocate a previously allocated frame.
         
+        Unless clear is set, the frame's old bytes are only zeroed when it is next
+        allocated, so freeing frames that are never reused costs nothing.
+        
         Args:
             frame_number (int): The frame number to deallocate.
+            clear (bool): Zero the frame's data now instead of on reuse.
             
         Raises:
             IndexError: If the frame number is invalid.
@@ -144,12 +210,15 @@ class RAM:
         if not self.frame_table[frame_number]:
             raise ValueError(f"Frame {frame_number} is already free")
             
-        self.frame_table[frame_number] = False
+        self.frame_table[frame_number] = 0
+        heapq.heappush(self._free_frames, frame_number)
+        self._used_count -= 1
+        self.frame_version += 1
         
-        # Optionally clear the frame data
-        start_address = frame_number * self.frame_size
-        for i in range(self.frame_size):
-            self.memory[start_address + i] = 0
+        if clear:
+            self._clear_frame(frame_number)
+        else:
+            self._stale_frames[frame_number] = 1
     
     def get_free_frames_count(self):
         """
@@ -158,7 +227,7 @@ class RAM:
         Returns:
             int: Number of free frames.
         """
-        return self.frame_table.count(False)
+        return self.num_frames - self._used_count
     
     def get_memory_usage(self):
         """
@@ -167,7 +236,7 @@ class RAM:
         Returns:
             dict: A dictionary containing memory usage statistics.
         """
-        used_frames = self.frame_table.count(True)
+        used_frames = self._used_count
         return {
             'total_size': self.size,
             'frame_size': self.frame_size,
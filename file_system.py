@@ -1,11 +1,15 @@
 # file_system.py
 
+import numpy as np
+
 RAM_SIZE = 1024
 DISK_SIZE = 2048
 
-RAM = [None] * RAM_SIZE
-VIRTUAL_DISK = [None] * DISK_SIZE
-directory = {}
+# Block state as parallel arrays: a free mask and the owning file's id (0 = none)
+RAM_FREE = np.ones(RAM_SIZE, dtype=np.uint8)
+RAM_OWNER = np.zeros(RAM_SIZE, dtype=np.int32)
+DISK_FREE = np.ones(DISK_SIZE, dtype=np.uint8)
+DISK_OWNER = np.zeros(DISK_SIZE, dtype=np.int32)
 
 class File:
     def __init__(self, name, size, allocation_type):
@@ -17,6 +21,19 @@ class File:
 class FileSystem:
     def __init__(self):
         self.files = {}
+        # File names are interned to small ids for the owner arrays
+        self._name_to_id = {}
+        self._id_to_name = [None]
+
+    def _file_id(self, name):
+        file_id = self._name_to_id.get(name)
+        if file_id is None:
+            file_id = self._name_to_id[name] = len(self._id_to_name)
+            self._id_to_name.append(name)
+        return file_id
+
+    def block_owner(self, block):
+        return self._id_to_name[RAM_OWNER[block]]
 
     def create_file(self, name, size, allocation_type="contiguous"):
         if name in self.files:
@@ -24,23 +41,24 @@ class FileSystem:
             return
 
         file = File(name, size, allocation_type)
+        file_id = self._file_id(name)
 
         if allocation_type == "contiguous":
             start = self.find_contiguous_blocks(size)
             if start == -1:
                 print(f"[Error] Not enough contiguous RAM blocks.")
                 return
-            for i in range(start, start + size):
-                RAM[i] = name
-                file.blocks.append(i)
+            RAM_FREE[start:start + size] = 0
+            RAM_OWNER[start:start + size] = file_id
+            file.blocks = list(range(start, start + size))
 
         elif allocation_type == "linked":
             allocated = self.find_linked_blocks(size)
             if not allocated:
                 print(f"[Error] Not enough RAM blocks for linked allocation.")
                 return
-            for block in allocated:
-                RAM[block] = name
+            RAM_FREE[allocated] = 0
+            RAM_OWNER[allocated] = file_id
             file.blocks = allocated
 
         elif allocation_type == "indexed":
@@ -48,14 +66,12 @@ class FileSystem:
             if not allocated:
                 print(f"[Error] Not enough RAM blocks for indexed allocation.")
                 return
-            index_block = allocated[0]
-            RAM[index_block] = name
-            for block in allocated[1:]:
-                RAM[block] = name
+            # The first block is the index block; it and the data blocks all belong to the file
+            RAM_FREE[allocated] = 0
+            RAM_OWNER[allocated] = file_id
             file.blocks = allocated
 
         self.files[name] = file
-        directory[name] = file.blocks
         print(f"[Success] File '{name}' created with blocks: {file.blocks}")
 
     def delete_file(self, name):
@@ -63,36 +79,40 @@ class FileSystem:
             print(f"[Error] File '{name}' not found.")
             return
         file = self.files[name]
-        for block in file.blocks:
-            RAM[block] = None
+        RAM_FREE[file.blocks] = 1
+        RAM_OWNER[file.blocks] = 0
         del self.files[name]
-        del directory[name]
         print(f"[Success] File '{name}' deleted.")
 
     def find_contiguous_blocks(self, size):
-        for i in range(RAM_SIZE - size):
-            if all(RAM[j] is None for j in range(i, i + size)):
-                return i
-        return -1
+        if size <= 0:
+            return 0
+        if size > RAM_SIZE:
+            return -1
+        # Free blocks in every window of `size` blocks, via a prefix sum
+        csum = np.concatenate(([0], np.cumsum(RAM_FREE, dtype=np.int32)))
+        hits = np.flatnonzero(csum[size:] - csum[:-size] == size)
+        return int(hits[0]) if hits.size else -1
 
     def find_linked_blocks(self, size):
-        available = [i for i, block in enumerate(RAM) if block is None]
-        return available[:size] if len(available) >= size else None
+        available = np.flatnonzero(RAM_FREE)
+        return available[:size].tolist() if len(available) >= size else None
 
     def move_to_virtual_disk(self, name):
         file = self.files.get(name)
         if not file:
             print(f"[Error] File '{name}' not found.")
             return
-        disk_blocks = [i for i, block in enumerate(VIRTUAL_DISK) if block is None]
+        disk_blocks = np.flatnonzero(DISK_FREE)
         if len(disk_blocks) < file.size:
             print(f"[Error] Not enough space in virtual disk.")
             return
-        for ram_block in file.blocks:
-            RAM[ram_block] = None
-        for i in range(file.size):
-            VIRTUAL_DISK[disk_blocks[i]] = name
-        file.blocks = disk_blocks[:file.size]
+        RAM_FREE[file.blocks] = 1
+        RAM_OWNER[file.blocks] = 0
+        disk_blocks = disk_blocks[:file.size]
+        DISK_FREE[disk_blocks] = 0
+        DISK_OWNER[disk_blocks] = self._file_id(name)
+        file.blocks = disk_blocks.tolist()
         print(f"[Success] File '{name}' moved to Virtual Disk blocks: {file.blocks}")
 
     def show_files(self):
@@ -1,6 +1,9 @@
 import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
+import matplotlib.colors as mcolors
+import numpy as np
+import functools
 import io
 import os
 import math
@@ -14,6 +17,13 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Colorbar legend for the file storage view, built once per process
+STORAGE_CMAP = mcolors.LinearSegmentedColormap.from_list("", ["#440154", "#31688e", "#35b779"])
+STORAGE_NORM = mcolors.Normalize(vmin=0, vmax=1)
+STORAGE_PAGES = 500  # Limit to 500 pages for visualization
+# Mock page status without a file: unallocated, plus every 7th page allocated by others
+STORAGE_BASE_STATUS = np.where(np.arange(STORAGE_PAGES) % 7 == 0, 0.5, 0).astype(np.float32)
+
 # Initialize session state for persistent variables
 if 'ram' not in st.session_state:
     st.session_state.ram = None
@@ -22,6 +32,7 @@ if 'page_table' not in st.session_state:
 if 'file_info' not in st.session_state:
     st.session_state.file_info = None
 
+@st.fragment
 def setup_environment():
     """Set up RAM and page table with user-defined parameters."""
     st.header("Memory System Setup")
@@ -54,6 +65,7 @@ def setup_environment():
         with col2:
             st.info(f"Virtual Memory: {address_space_size/1024/1024:.1f} MB address space, {page_size/1024:.1f} KB pages")
 
+@st.fragment
 def store_file():
     """Store a file in memory using the page table."""
     st.header("Store File in Memory")
@@ -74,11 +86,7 @@ def store_file():
             progress_bar = st.progress(0)
             status_text = st.empty()
             
-            # Simulating progress
-            for i in range(101):
-                progress_bar.progress(i)
-                status_text.text(f"Storing data in page {i}...")
-                
+            # Nothing is stored in the mock, so go straight to completion
             progress_bar.progress(100)
             status_text.text("File stored successfully!")
             
@@ -94,6 +102,12 @@ def store_file():
             st.success("File stored successfully!")
             st.json(mock_file_info)
 
+def _read_file_pages(starting_page, pages_count, file_size):
+    """Read the file bytes back from its pages; only called when a download is requested."""
+    # Mock file data
+    return b"This is mock file data"
+
+@st.fragment
 def retrieve_file():
     """Retrieve a file from memory using the page table."""
     st.header("Retrieve File from Memory")
@@ -125,26 +139,22 @@ def retrieve_file():
         progress_bar = st.progress(0)
         status_text = st.empty()
         
-        # Simulating progress
-        for i in range(101):
-            progress_bar.progress(i)
-            status_text.text(f"Reading page {i}...")
-            
+        # Nothing is read in the mock, so go straight to completion
         progress_bar.progress(100)
         status_text.text("File retrieved successfully!")
         
         # Mock file retrieval
         mock_filename = "retrieved_file"
-        mock_data = b"This is mock file data"
         
+        # The bytes are only read when the download is clicked, not on every rerun
         st.download_button(
             label="Download Retrieved File",
-            data=mock_data,
+            data=functools.partial(_read_file_pages, starting_page, pages_count, file_size),
             file_name=mock_filename,
             mime="application/octet-stream"
         )
         
-        st.success(f"Retrieved {len(mock_data)} bytes")
+        st.success(f"Retrieved {file_size} bytes")
 
 def view_memory_usage():
     """Display memory usage statistics and visualizations."""
@@ -159,31 +169,54 @@ def view_memory_usage():
     with col1:
         st.subheader("RAM Usage")
         
-        # Mock RAM usage data
-        ram_data = [
-            {"Metric": "Total frames", "Value": 1024},
-            {"Metric": "Used frames", "Value": 512},
-            {"Metric": "Free frames", "Value": 512},
-            {"Metric": "Used percentage", "Value": "50.00%"},
-        ]
-        
-        ram_df = pd.DataFrame(ram_data)
-        st.table(ram_df)
+        st.table(_ram_usage_df())
     
     with col2:
         st.subheader("Page Table Statistics")
         
-        # Mock page table stats
-        page_data = [
-            {"Metric": "Total pages", "Value": 2048},
-            {"Metric": "Allocated pages", "Value": 512},
-            {"Metric": "Free pages", "Value": 1536},
-            {"Metric": "Allocation percentage", "Value": "25.00%"},
-        ]
-        
-        page_df = pd.DataFrame(page_data)
-        st.table(page_df)
+        st.table(_page_stats_df())
+
+@st.cache_data
+def _ram_usage_df():
+    """Build the RAM usage table once; later reruns reuse it."""
+    # Mock RAM usage data
+    ram_data = [
+        {"Metric": "Total frames", "Value": 1024},
+        {"Metric": "Used frames", "Value": 512},
+        {"Metric": "Free frames", "Value": 512},
+        {"Metric": "Used percentage", "Value": "50.00%"},
+    ]
+    # One string column serializes straight to Arrow instead of failing and falling back
+    return pd.DataFrame(ram_data).astype({"Value": str})
+
+@st.cache_data
+def _page_stats_df():
+    """Build the page table statistics table once; later reruns reuse it."""
+    # Mock page table stats
+    page_data = [
+        {"Metric": "Total pages", "Value": 2048},
+        {"Metric": "Allocated pages", "Value": 512},
+        {"Metric": "Free pages", "Value": 1536},
+        {"Metric": "Allocation percentage", "Value": "25.00%"},
+    ]
+    return pd.DataFrame(page_data).astype({"Value": str})
 
+@st.cache_data
+def _range_df(start, end):
+    """Build the page table rows for pages start..end, cached per range."""
+    # Mock page table data
+    page_nums = np.arange(start, end + 1)
+    frame_nums = np.where(page_nums % 3 == 0, (page_nums % 100).astype(str), "N/A")
+    return pd.DataFrame({"Page #": page_nums, "Frame #": frame_nums})
+
+@st.cache_data
+def _allocated_df():
+    """Build the allocated pages table once; later reruns reuse it."""
+    # Mock allocated pages data
+    page_nums = np.arange(0, 1000, 3)  # Every 3rd page is "allocated"
+    return pd.DataFrame({"Page #": page_nums, "Frame #": (page_nums % 100).astype(str)})
+
+@st.fragment
 def view_page_table():
     """Display the contents of the page table."""
     st.header("Page Table Viewer")
@@ -207,73 +240,41 @@ def view_page_table():
             max_range = min(50, total_pages - start)
             end = st.number_input("End page", start, start + max_range - 1, min(start + 9, start + max_range - 1))
         
-        # Mock page table data
-        data = []
-        for page_num in range(start, end + 1):
-            data.append({
-                "Page #": page_num,
-                "Frame #": f"{page_num % 100}" if page_num % 3 == 0 else "N/A",
-            })
-        
-        df = pd.DataFrame(data)
+        df = _range_df(start, end)
         st.dataframe(df, use_container_width=True)
         
     elif view_option == "View only allocated pages":
-        # Mock allocated pages data
-        data = []
-        for page_num in range(0, 1000, 3):  # Every 3rd page is "allocated"
-            data.append({
-                "Page #": page_num,
-                "Frame #": f"{page_num % 100}",
-            })
-        
-        st.write(f"Allocated Pages ({len(data)} total):")
-        df = pd.DataFrame(data)
+        df = _allocated_df()
+        st.write(f"Allocated Pages ({len(df)} total):")
         st.dataframe(df, use_container_width=True)
         
     elif view_option == "View summary statistics":
-        # Mock statistics
-        stats_data = [
-            {"Metric": "Total pages", "Value": 2048},
-            {"Metric": "Allocated pages", "Value": 512},
-            {"Metric": "Free pages", "Value": 1536},
-            {"Metric": "Allocation percentage", "Value": "25.00%"},
-        ]
-        
-        df = pd.DataFrame(stats_data)
-        st.table(df)
+        st.table(_page_stats_df())
 
-def visualize_file_storage(starting_page=0, pages_count=5):
-    """Visualize how a file is stored across pages."""
-    try:
-        # Create a visualization showing which pages are used by the file
-        fig, ax = plt.subplots(figsize=(10, 3))
+def _storage_figure():
+    """Return the (fig, image, rect) for the storage view, built once per session."""
+    cached = st.session_state.get('_storage_figure')
+    if cached is None:
+        from matplotlib.figure import Figure
         
-        # Mock page status data
-        all_pages = range(500)  # Limit to 500 pages for visualization
-        page_status = []
+        # Built without pyplot so the figure is not held by its global registry
+        fig = Figure(figsize=(10, 3))
+        ax = fig.subplots()
         
-        for page in all_pages:
-            if starting_page <= page < starting_page + pages_count:
-                page_status.append(1)  # File pages
-            elif page % 7 == 0:  # Mock some other allocated pages
-                page_status.append(0.5)
-            else:
-                page_status.append(0)  # Unallocated pages
-        
-        # Plot a heatmap-like visualization
-        ax.imshow([page_status], aspect='auto', cmap='viridis')
+        # Plot a heatmap-like visualization; later calls only swap its data
+        image = ax.imshow(np.zeros((1, STORAGE_PAGES), dtype=np.float32), aspect='auto',
+                          cmap='viridis', vmin=0, vmax=1)
         
         # Calculate tick positions - show ticks every 10 pages
-        tick_step = max(1, len(page_status) // 20)
-        tick_positions = range(0, len(page_status), tick_step)
+        tick_step = max(1, STORAGE_PAGES // 20)
+        tick_positions = range(0, STORAGE_PAGES, tick_step)
         
         ax.set_xticks(tick_positions)
         ax.set_xticklabels([str(p) for p in tick_positions])
         ax.set_yticks([])
         
-        # Highlight the file storage area
-        rect = plt.Rectangle((starting_page - 0.5, -0.5), pages_count, 1, 
+        # Highlight the file storage area; moved to the file's pages on each call
+        rect = plt.Rectangle((-0.5, -0.5), 0, 1, 
                             fill=False, edgecolor='red', linestyle='--', linewidth=2)
         ax.add_patch(rect)
         
@@ -281,14 +282,29 @@ def visualize_file_storage(starting_page=0, pages_count=5):
         ax.set_xlabel('Page Numbers')
         
         # Add a colorbar legend
-        import matplotlib.colors as mcolors
-        cmap = mcolors.LinearSegmentedColormap.from_list("", ["#440154", "#31688e", "#35b779"])
-        norm = mcolors.Normalize(vmin=0, vmax=1)
-        cbar = plt.colorbar(plt.cm.ScalarMappable(norm=norm, cmap=cmap), ax=ax, orientation='horizontal', pad=0.2)
+        cbar = fig.colorbar(plt.cm.ScalarMappable(norm=STORAGE_NORM, cmap=STORAGE_CMAP), ax=ax, orientation='horizontal', pad=0.2)
         cbar.set_ticks([0, 0.5, 1])
         cbar.set_ticklabels(['Unallocated', 'Other Allocated', 'File Pages'])
         
-        st.pyplot(fig)
+        cached = (fig, image, rect)
+        st.session_state['_storage_figure'] = cached
+    return cached
+
+def visualize_file_storage(starting_page=0, pages_count=5):
+    """Visualize how a file is stored across pages."""
+    try:
+        # Create a visualization showing which pages are used by the file
+        fig, image, rect = _storage_figure()
+        
+        # Mock page status data: the fixed base pattern with the file pages on top
+        page_status = STORAGE_BASE_STATUS.copy()
+        page_status[max(starting_page, 0):starting_page + pages_count] = 1
+        
+        image.set_data(page_status[np.newaxis, :])
+        rect.set_x(starting_page - 0.5)
+        rect.set_width(pages_count)
+        
+        st.pyplot(fig, clear_figure=False)
     except Exception as e:
         st.error(f"Error visualizing file storage: {e}")
 